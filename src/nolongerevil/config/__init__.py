@@ -1,5 +1,18 @@
 """Configuration module."""
 
-from .environment import settings
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["settings"]
+from .environment import Settings, get_settings
+
+if TYPE_CHECKING:
+    settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    # Backward compatibility: `settings` resolves lazily to the shared instance
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["Settings", "get_settings", "settings"]
@@ -1,12 +1,49 @@
 """Environment configuration with validation."""
 
+from functools import cached_property, lru_cache
 from pathlib import Path
-from urllib.parse import urlparse, urlunparse
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlsplit, urlunsplit
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def _with_explicit_port(origin: str, port: int) -> str:
+    """Ensure a URL's authority carries an explicit port.
+
+    Scans the authority directly instead of running a full URL parse; only
+    inputs without a "scheme://" prefix fall back to the parser.
+
+    Args:
+        origin: URL to check
+        port: Port to insert when the URL has none
+
+    Returns:
+        URL with an explicit port
+    """
+    scheme_end = origin.find("://")
+    if scheme_end == -1:
+        parsed = urlsplit(origin)
+        if parsed.port is None:
+            return urlunsplit(parsed._replace(netloc=f"{parsed.hostname}:{port}"))
+        return origin
+
+    auth_start = scheme_end + 3
+    auth_end = len(origin)
+    for sep in "/?#":
+        idx = origin.find(sep, auth_start, auth_end)
+        if idx != -1:
+            auth_end = idx
+
+    # Skip userinfo and any bracketed IPv6 literal before looking for a port
+    authority = origin[auth_start:auth_end]
+    host = authority[authority.rfind("@") + 1 :]
+    if ":" in host[host.rfind("]") + 1 :]:
+        return origin
+    return f"{origin[:auth_end]}:{port}{origin[auth_end:]}"
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
 
@@ -103,6 +140,19 @@ class Settings(BaseSettings):
         default="./data/debug-logs",
         description="Directory for debug log files",
     )
+    debug_log_success: bool = Field(
+        default=True,
+        description="Include successful (2xx) requests in debug logs",
+    )
+    debug_log_max_body: int = Field(
+        default=65536,
+        description="Largest JSON request body (bytes) captured in debug logs",
+    )
+    debug_logs_http: bool = Field(
+        default=False,
+        description="Serve the debug logs directory at /debug/logs on the control API "
+        "(requires an API key with the admin scope)",
+    )
     store_device_logs: bool = Field(
         default=False,
         description="Store uploaded device logs to disk",
@@ -147,19 +197,18 @@ class Settings(BaseSettings):
             return None
         return f"mqtt://{self.mqtt_host}:{self.mqtt_port}"
 
-    @property
+    @cached_property
     def api_origin_with_port(self) -> str:
         """Get API origin with explicit port for device URLs.
 
         URLs without explicit ports may cause the device to fail port extraction,
         breaking TCP keepalive offload (WoWLAN). This ensures the port is always
         explicit in URLs sent to devices.
+
+        Computed once per instance; api_origin and server_port do not change
+        after startup.
         """
-        parsed = urlparse(self.api_origin)
-        if parsed.port is None:
-            netloc = f"{parsed.hostname}:{self.server_port}"
-            return urlunparse(parsed._replace(netloc=netloc))
-        return self.api_origin
+        return _with_explicit_port(self.api_origin, self.server_port)
 
     @property
     def weather_cache_ttl_seconds(self) -> float:
@@ -191,4 +240,25 @@ class Settings(BaseSettings):
             Path(self.debug_logs_dir).mkdir(parents=True, exist_ok=True)
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Get the process-wide settings instance.
+
+    Settings are validated and the .env file is read on first call rather
+    than at import time.
+
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
+
+
+if TYPE_CHECKING:
+    settings: Settings
+
+
+def __getattr__(name: str) -> Any:
+    # Backward compatibility: `settings` resolves lazily to the shared instance
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
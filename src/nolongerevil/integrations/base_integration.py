@@ -13,6 +13,8 @@ class BaseIntegration(ABC):
     and can perform actions like publishing to MQTT, sending webhooks, etc.
     """
 
+    __slots__ = ("config", "user_id", "type", "enabled")
+
     def __init__(self, config: IntegrationConfig) -> None:
         """Initialize the integration.
 
@@ -22,12 +24,7 @@ class BaseIntegration(ABC):
         self.config = config
         self.user_id = config.user_id
         self.type = config.type
-        self._enabled = config.enabled
-
-    @property
-    def enabled(self) -> bool:
-        """Check if integration is enabled."""
-        return self._enabled
+        self.enabled: bool = config.enabled
 
     @abstractmethod
     async def initialize(self) -> None:
@@ -69,6 +66,9 @@ class BaseIntegration(ABC):
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """Get a configuration value.
 
+        Intended for use in __init__: subclasses should store values they need
+        on hot paths as instance attributes instead of re-reading them per event.
+
         Args:
             key: Configuration key
             default: Default value if key not found
@@ -16,7 +16,7 @@ Inbound (MQTT → device):
     {prefix}/+/ha/+/set    — HA-native commands (e.g., .../ha/mode/set)
 - Dispatches commands via execute_command() from command.py, which merges
   into the correct bucket and pushes to the device via
-  subscription_manager.notify_all_subscribers()
+  subscription_manager.notify_subscribers_with_objects()
 
 Eco mode:
 - HA "eco" preset maps to set_away(True) → manual_eco_all in structure bucket
@@ -27,7 +27,6 @@ Eco mode:
 import asyncio
 import contextlib
 import json
-import re
 import ssl
 import time
 from typing import TYPE_CHECKING, Any
@@ -51,12 +50,15 @@ from nolongerevil.integrations.mqtt.helpers import (
     nest_mode_to_ha,
 )
 from nolongerevil.integrations.mqtt.home_assistant_discovery import (
-    get_all_discovery_configs,
+    get_all_discovery_configs_encoded,
     get_discovery_removal_topics,
 )
 from nolongerevil.integrations.mqtt.topic_builder import (
+    COMMAND_SUFFIX,
     build_availability_topic,
     build_state_topic,
+    make_command_parser,
+    make_ha_command_parser,
     parse_object_key,
 )
 from nolongerevil.lib.consts import HaPreset
@@ -104,6 +106,10 @@ class MqttIntegration(BaseIntegration):
         self._ha_discovery = self.get_config_value("homeAssistantDiscovery", False)
         self._publish_raw = self.get_config_value("publishRaw", True)
 
+        # Command topic parsers bound to the configured prefix
+        self._parse_command_topic = make_command_parser(self._topic_prefix)
+        self._parse_ha_command_topic = make_ha_command_parser(self._topic_prefix)
+
     async def initialize(self) -> None:
         """Initialize the MQTT connection."""
         try:
@@ -201,7 +207,11 @@ class MqttIntegration(BaseIntegration):
         message: aiomqtt.Message,
     ) -> None:
         """Handle incoming MQTT message."""
-        topic = str(message.topic)
+        # paho has already decoded the topic; only command topics are handled
+        topic = message.topic.value
+        if not topic.endswith(COMMAND_SUFFIX):
+            return
+
         raw_payload = message.payload
         if isinstance(raw_payload, (bytes, bytearray)):
             payload = raw_payload.decode()
@@ -211,24 +221,21 @@ class MqttIntegration(BaseIntegration):
             payload = ""
 
         # Handle HA command topics
-        if "/ha/" in topic and topic.endswith("/set"):
+        if "/ha/" in topic:
             await self._handle_ha_command(topic, payload)
             return
 
         # Handle raw command topics
-        if topic.endswith("/set"):
-            await self._handle_raw_command(topic, payload)
+        await self._handle_raw_command(topic, payload)
 
     async def _handle_ha_command(self, topic: str, payload: str) -> None:
         """Handle Home Assistant formatted command."""
-        prefix = self._topic_prefix
-        escaped_prefix = re.escape(prefix)
-        match = re.match(rf"^{escaped_prefix}/([^/]+)/ha/(.+)/set$", topic)
-        if not match:
+        parsed = self._parse_ha_command_topic(topic)
+        if not parsed:
             logger.warning(f"Invalid HA command topic: {topic}")
             return
 
-        serial, command = match.groups()
+        serial, command = parsed
         logger.info(f"HA Command: {serial}/{command} = {payload}")
 
         device_obj = self._state_service.get_object(serial, f"device.{serial}")
@@ -355,13 +362,11 @@ class MqttIntegration(BaseIntegration):
 
     async def _handle_raw_command(self, topic: str, payload: str) -> None:
         """Handle raw MQTT command."""
-        prefix = self._topic_prefix
-        escaped_prefix = re.escape(prefix)
-        match = re.match(rf"^{escaped_prefix}/([^/]+)/([^/]+)/([^/]+)/set$", topic)
-        if not match:
+        parsed = self._parse_command_topic(topic)
+        if not parsed:
             return
 
-        serial, object_type, field = match.groups()
+        serial, object_type, field = parsed
 
         # Parse value
         value: Any = payload
@@ -403,7 +408,7 @@ class MqttIntegration(BaseIntegration):
 
         # Push to subscribed device immediately
         if self._subscription_manager:
-            await self._subscription_manager.notify_all_subscribers(serial, [obj])
+            await self._subscription_manager.notify_subscribers_with_objects(serial, [obj])
 
     async def _update_device_value(
         self, serial: str, current_obj: Any, field: str, value: Any
@@ -431,7 +436,7 @@ class MqttIntegration(BaseIntegration):
 
         # Push to subscribed device immediately
         if self._subscription_manager:
-            await self._subscription_manager.notify_all_subscribers(serial, [obj])
+            await self._subscription_manager.notify_subscribers_with_objects(serial, [obj])
 
     async def on_device_state_change(self, change: DeviceStateChange) -> None:
         """Handle device state change by publishing to MQTT."""
@@ -810,7 +815,7 @@ class MqttIntegration(BaseIntegration):
         device_values = device_obj.value if device_obj else {}
         shared_values = shared_obj.value if shared_obj else {}
 
-        configs = get_all_discovery_configs(
+        configs = get_all_discovery_configs_encoded(
             serial,
             device_values,
             shared_values,
@@ -819,7 +824,7 @@ class MqttIntegration(BaseIntegration):
         )
 
         for topic, payload in configs:
-            await client.publish(topic, json.dumps(payload), retain=True)
+            await client.publish(topic, payload, retain=True)
 
         ha_mode = nest_mode_to_ha(shared_values.get("target_temperature_type"))
         logger.info(f"Published HA discovery for {serial} (mode: {ha_mode})")
@@ -1,6 +1,9 @@
 """MQTT topic builder utilities."""
 
-import re
+from collections.abc import Callable
+from functools import lru_cache
+
+COMMAND_SUFFIX = "/set"
 
 
 def parse_object_key(object_key: str) -> tuple[str, str]:
@@ -12,12 +15,15 @@ def parse_object_key(object_key: str) -> tuple[str, str]:
     Returns:
         Tuple of (object_type, serial)
     """
-    parts = object_key.split(".", 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
+    object_type, sep, serial = object_key.partition(".")
+    if sep:
+        return object_type, serial
     return object_key, ""
 
 
+# Topic builders are called per field on every state change with a small,
+# repeating set of arguments, so their results are memoized.
+@lru_cache(maxsize=4096)
 def build_state_topic(prefix: str, serial: str, object_type: str, field: str | None = None) -> str:
     """Build a state topic.
 
@@ -35,6 +41,7 @@ def build_state_topic(prefix: str, serial: str, object_type: str, field: str | N
     return f"{prefix}/{serial}/{object_type}"
 
 
+@lru_cache(maxsize=4096)
 def build_command_topic(prefix: str, serial: str, object_type: str, field: str) -> str:
     """Build a command topic.
 
@@ -47,9 +54,10 @@ def build_command_topic(prefix: str, serial: str, object_type: str, field: str)
     Returns:
         Command topic string
     """
-    return f"{prefix}/{serial}/{object_type}/{field}/set"
+    return f"{prefix}/{serial}/{object_type}/{field}{COMMAND_SUFFIX}"
 
 
+@lru_cache(maxsize=4096)
 def build_availability_topic(prefix: str, serial: str) -> str:
     """Build an availability topic.
 
@@ -75,6 +83,63 @@ def build_command_pattern(prefix: str) -> str:
     return f"{prefix}/+/+/+/set"
 
 
+@lru_cache(maxsize=8)
+def make_command_parser(prefix: str) -> Callable[[str], tuple[str, str, str] | None]:
+    """Build a raw command topic parser bound to a fixed prefix.
+
+    The prefix-dependent strings are computed once, so callers that know their
+    prefix up front (e.g. the MQTT subscriber) pay only the string checks per
+    message.
+
+    Args:
+        prefix: Expected topic prefix
+
+    Returns:
+        Function mapping a topic to (serial, object_type, field), or None if invalid
+    """
+    head = f"{prefix}/"
+    start = len(head)
+    end = -len(COMMAND_SUFFIX)
+
+    def parse(topic: str) -> tuple[str, str, str] | None:
+        if not topic.startswith(head) or not topic.endswith(COMMAND_SUFFIX):
+            return None
+
+        parts = topic[start:end].split("/")
+        if len(parts) != 3 or not all(parts):
+            return None
+        return parts[0], parts[1], parts[2]
+
+    return parse
+
+
+@lru_cache(maxsize=8)
+def make_ha_command_parser(prefix: str) -> Callable[[str], tuple[str, str] | None]:
+    """Build a Home Assistant command topic parser bound to a fixed prefix.
+
+    Args:
+        prefix: Expected topic prefix
+
+    Returns:
+        Function mapping a topic to (serial, command), or None if invalid
+    """
+    head = f"{prefix}/"
+    start = len(head)
+    end = -len(COMMAND_SUFFIX)
+
+    def parse(topic: str) -> tuple[str, str] | None:
+        if not topic.startswith(head) or not topic.endswith(COMMAND_SUFFIX):
+            return None
+
+        # {serial}/ha/{command}, where command may itself contain slashes
+        serial, _, rest = topic[start:end].partition("/")
+        if not serial or not rest.startswith("ha/") or len(rest) == 3:
+            return None
+        return serial, rest[3:]
+
+    return parse
+
+
 def parse_command_topic(prefix: str, topic: str) -> tuple[str, str, str] | None:
     """Parse a command topic into components.
 
@@ -85,9 +150,17 @@ def parse_command_topic(prefix: str, topic: str) -> tuple[str, str, str] | None:
     Returns:
         Tuple of (serial, object_type, field) or None if invalid
     """
-    pattern = rf"^{re.escape(prefix)}/([^/]+)/([^/]+)/([^/]+)/set$"
-    match = re.match(pattern, topic)
+    return make_command_parser(prefix)(topic)
 
-    if match:
-        return match.group(1), match.group(2), match.group(3)
-    return None
+
+def parse_ha_command_topic(prefix: str, topic: str) -> tuple[str, str] | None:
+    """Parse a Home Assistant command topic into components.
+
+    Args:
+        prefix: Expected topic prefix
+        topic: Full topic string (e.g., "{prefix}/{serial}/ha/mode/set")
+
+    Returns:
+        Tuple of (serial, command) or None if invalid
+    """
+    return make_ha_command_parser(prefix)(topic)
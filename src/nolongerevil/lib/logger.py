@@ -3,7 +3,7 @@
 import logging
 import sys
 
-from nolongerevil.config import settings
+from nolongerevil.config import get_settings
 
 
 class ColoredFormatter(logging.Formatter):
@@ -56,7 +56,7 @@ def get_logger(name: str) -> logging.Logger:
     # Only configure if not already configured
     if not logger.handlers:
         # Set level based on debug setting
-        level = logging.DEBUG if settings.debug_logging else logging.INFO
+        level = logging.DEBUG if get_settings().debug_logging else logging.INFO
         logger.setLevel(level)
 
         # Create console handler
@@ -8,6 +8,13 @@ from aiohttp import web
 # Minimum length for a valid Nest device serial
 MIN_SERIAL_LENGTH = 10
 
+# Anything that is not an ASCII letter or digit is stripped from serials
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+_VALID_SERIAL_RE = re.compile(r"[A-Z0-9]+")
+
+# Request storage key for the memoized result of extract_serial_from_request
+_SERIAL_REQUEST_KEY = "nolongerevil_serial"
+
 
 def sanitize_serial(serial: str | None) -> str | None:
     """Sanitize and validate a device serial number.
@@ -21,8 +28,11 @@ def sanitize_serial(serial: str | None) -> str | None:
     if not serial:
         return None
 
-    # Remove all non-alphanumeric characters and convert to uppercase
-    cleaned = re.sub(r"[^a-zA-Z0-9]", "", serial).upper()
+    # Remove all non-alphanumeric characters and convert to uppercase; serials
+    # that are already clean skip the regex pass
+    if not (serial.isascii() and serial.isalnum()):
+        serial = _NON_ALNUM_RE.sub("", serial)
+    cleaned = serial.upper()
 
     # Validate minimum length
     if len(cleaned) < MIN_SERIAL_LENGTH:
@@ -115,6 +125,25 @@ def extract_serial_from_client_id(client_id: str | None) -> str | None:
 def extract_serial_from_request(request: web.Request) -> str | None:
     """Extract device serial from an aiohttp request.
 
+    The result is memoized on the request, so the middlewares and the route
+    handler share a single extraction per request.
+
+    Args:
+        request: aiohttp web request
+
+    Returns:
+        Sanitized serial or None if not found
+    """
+    if _SERIAL_REQUEST_KEY in request:
+        return request[_SERIAL_REQUEST_KEY]
+    serial = _extract_serial_from_request(request)
+    request[_SERIAL_REQUEST_KEY] = serial
+    return serial
+
+
+def _extract_serial_from_request(request: web.Request) -> str | None:
+    """Extract device serial from an aiohttp request (uncached).
+
     Tries multiple sources in order:
     1. Authorization header (Basic Auth username)
     2. X-nl-client-id header (subscribe requests with DEFAULT creds)
@@ -190,7 +219,7 @@ def is_valid_serial(serial: str | None) -> bool:
         return False
 
     # Must be uppercase alphanumeric and meet minimum length
-    if not re.match(r"^[A-Z0-9]+$", serial):
+    if not _VALID_SERIAL_RE.fullmatch(serial):
         return False
 
     return len(serial) >= MIN_SERIAL_LENGTH
@@ -115,7 +115,7 @@ class DeviceShareInvite:
     shared_with_user_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class APIKeyPermissions:
     """Permissions for an API key."""
 
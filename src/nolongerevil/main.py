@@ -9,10 +9,11 @@ from pathlib import Path
 
 from aiohttp import web
 
-from nolongerevil.config import settings
+from nolongerevil.config import get_settings
 from nolongerevil.integrations.integration_manager import IntegrationManager
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.types import UserInfo
+from nolongerevil.middleware.api_key_auth import create_api_key_middleware
 from nolongerevil.middleware.debug_logger import create_debug_logger_middleware
 from nolongerevil.middleware.device_auth import create_device_auth_middleware
 from nolongerevil.middleware.device_heartbeat import create_device_heartbeat_middleware
@@ -27,6 +28,9 @@ from nolongerevil.services.weather_service import WeatherService
 
 logger = get_logger(__name__)
 
+# Control API path under which debug logs are served when enabled
+DEBUG_LOGS_PREFIX = "/debug/logs"
+
 
 async def ensure_homeassistant_user(storage: SQLModelService) -> None:
     """Ensure the homeassistant user exists in the database.
@@ -58,6 +62,7 @@ async def initialize_mqtt_config(storage: SQLModelService) -> None:
     """
     from nolongerevil.lib.types import IntegrationConfig
 
+    settings = get_settings()
     if not settings.mqtt_host:
         logger.warning("MQTT not configured - no MQTT_HOST environment variable")
         return
@@ -131,12 +136,13 @@ def create_proxy_app(
     Returns:
         aiohttp Application
     """
-    app = web.Application(
-        middlewares=[
+    app = web.Application()
+    app.middlewares.extend(
+        [
             create_url_normalizer_middleware(),  # type: ignore[list-item] # Must be first - before body reading
             create_device_auth_middleware(),  # type: ignore[list-item] # Auth before heartbeat — reject unknown devices early
             create_device_heartbeat_middleware(device_availability),  # type: ignore[list-item]
-            create_debug_logger_middleware(),  # type: ignore[list-item]
+            create_debug_logger_middleware(app),  # type: ignore[list-item]
         ]
     )
 
@@ -186,6 +192,10 @@ def create_control_app(
         request: web.Request,
         handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
     ) -> web.StreamResponse:
+        # Debug logs hold device credentials; never expose them to other origins
+        if request.path.startswith(DEBUG_LOGS_PREFIX):
+            return await handler(request)
+
         if request.method == "OPTIONS":
             response: web.StreamResponse = web.Response()
         else:
@@ -196,9 +206,10 @@ def create_control_app(
         response.headers["Access-Control-Allow-Headers"] = "Content-Type, Authorization, X-API-Key"
         return response
 
-    app = web.Application(
-        middlewares=[
-            create_debug_logger_middleware(),  # type: ignore[list-item]
+    app = web.Application()
+    app.middlewares.extend(
+        [
+            create_debug_logger_middleware(app),  # type: ignore[list-item]
             cors_middleware,
         ]
     )
@@ -218,6 +229,18 @@ def create_control_app(
 
     app.router.add_get("/health", health_check)
 
+    # Debug log browsing (opt-in: the logs include device credentials, so an
+    # admin-scoped API key is required)
+    settings = get_settings()
+    if settings.debug_logging and settings.debug_logs_http:
+        debug_logs_app = web.Application(
+            middlewares=[create_api_key_middleware(state_service, "admin")]  # type: ignore[list-item]
+        )
+        debug_logs_app.router.add_static(
+            "/", settings.debug_logs_dir, show_index=True, follow_symlinks=False
+        )
+        app.add_subapp(DEBUG_LOGS_PREFIX, debug_logs_app)
+
     logger.info("Control API application created")
     return app
 
@@ -228,6 +251,7 @@ def get_ssl_context() -> ssl.SSLContext | None:
     Returns:
         SSL context or None
     """
+    settings = get_settings()
     if not settings.cert_dir:
         return None
 
@@ -247,6 +271,8 @@ def get_ssl_context() -> ssl.SSLContext | None:
 
 async def run_server() -> None:
     """Run the dual-port server."""
+    settings = get_settings()
+
     # Ensure data directory exists
     settings.ensure_data_dir()
 
@@ -347,8 +373,10 @@ async def run_server() -> None:
     # Graceful shutdown
     logger.info("Starting graceful shutdown...")
 
-    await integration_manager.stop()
+    # Stop availability first so its pending integration callbacks are cancelled
+    # before the integrations they publish to shut down
     await device_availability.stop()
+    await integration_manager.stop()
 
     await proxy_runner.cleanup()
     await control_runner.cleanup()
@@ -361,6 +389,7 @@ async def run_server() -> None:
 
 def main() -> None:
     """Main entry point."""
+    settings = get_settings()
     logger.info("Starting NoLongerEvil server...")
     logger.info(f"API Origin: {settings.api_origin}")
     logger.info(f"Server Port: {settings.server_port}")
@@ -3,6 +3,7 @@
 from .api_key_auth import (
     APIKeyContext,
     check_device_permission,
+    create_api_key_middleware,
     extract_api_key,
     require_api_key,
     validate_api_key,
@@ -15,6 +16,7 @@ from .url_normalizer import create_url_normalizer_middleware
 __all__ = [
     "APIKeyContext",
     "check_device_permission",
+    "create_api_key_middleware",
     "extract_api_key",
     "require_api_key",
     "validate_api_key",
@@ -179,31 +179,12 @@ def require_api_key(
     ) -> Callable[[web.Request], Awaitable[web.Response]]:
         @wraps(handler)
         async def wrapper(request: web.Request) -> web.Response:
-            # Extract API key
-            key = extract_api_key(request)
-            if not key:
-                return web.json_response(
-                    {"error": "API key required"},
-                    status=401,
-                )
-
-            # Validate API key
-            context = await validate_api_key(key, state_service)
-            if not context:
-                return web.json_response(
-                    {"error": "Invalid or expired API key"},
-                    status=401,
-                )
-
-            # Check scope
-            if required_scope not in context.api_key.permissions.scopes:
-                return web.json_response(
-                    {"error": f"Missing required scope: {required_scope}"},
-                    status=403,
-                )
+            result = await _authenticate(request, state_service, required_scope)
+            if isinstance(result, web.Response):
+                return result
 
             # Store context in request for handler
-            request["api_key_context"] = context
+            request["api_key_context"] = result
 
             return await handler(request)
 
@@ -212,6 +193,82 @@ def require_api_key(
     return decorator
 
 
+def create_api_key_middleware(
+    state_service: DeviceStateService,
+    required_scope: str = "read",
+) -> Callable[
+    [web.Request, Callable[[web.Request], Awaitable[web.StreamResponse]]],
+    Awaitable[web.StreamResponse],
+]:
+    """Create middleware that requires API key authentication for every route.
+
+    Intended for sub-applications (such as static file routes) whose handlers
+    cannot be wrapped with require_api_key.
+
+    Args:
+        state_service: Device state service
+        required_scope: Required scope for all routes
+
+    Returns:
+        Middleware function
+    """
+
+    @web.middleware
+    async def api_key_middleware(
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        result = await _authenticate(request, state_service, required_scope)
+        if isinstance(result, web.Response):
+            return result
+
+        request["api_key_context"] = result
+        return await handler(request)
+
+    return api_key_middleware
+
+
+async def _authenticate(
+    request: web.Request,
+    state_service: DeviceStateService,
+    required_scope: str,
+) -> APIKeyContext | web.Response:
+    """Authenticate a request by API key and check its scope.
+
+    Args:
+        request: aiohttp request object
+        state_service: Device state service
+        required_scope: Required scope
+
+    Returns:
+        API key context, or a 401/403 error response
+    """
+    # Extract API key
+    key = extract_api_key(request)
+    if not key:
+        return web.json_response(
+            {"error": "API key required"},
+            status=401,
+        )
+
+    # Validate API key
+    context = await validate_api_key(key, state_service)
+    if not context:
+        return web.json_response(
+            {"error": "Invalid or expired API key"},
+            status=401,
+        )
+
+    # Check scope
+    if required_scope not in context.api_key.permissions.scopes:
+        return web.json_response(
+            {"error": f"Missing required scope: {required_scope}"},
+            status=403,
+        )
+
+    return context
+
+
 def get_api_key_context(request: web.Request) -> APIKeyContext | None:
     """Get API key context from request.
 
@@ -1,13 +1,16 @@
 """Debug logging middleware for request/response inspection."""
 
-import json
+import asyncio
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Mapping
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, BinaryIO
 
+import orjson
 from aiohttp import web
 
-from nolongerevil.config import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.serial_parser import extract_serial_from_request
 
@@ -19,12 +22,131 @@ _MiddlewareType = Callable[
 ]
 
 
-def create_debug_logger_middleware() -> _MiddlewareType:
+_DUMP_OPTIONS = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+_WRITE_BUFFER_SIZE = 1 << 20
+# Logged in place of a request body that cannot be encoded
+_UNSERIALIZABLE = "<unserializable>"
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize values orjson does not handle natively.
+
+    Request headers and query parameters are queued as their (immutable)
+    multidict proxies and only copied into plain dicts here, in the writer.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+_ROUTE_TRANSLATION = str.maketrans("/", "_")
+
+
+@lru_cache(maxsize=256)
+def _route_name(path: str) -> str:
+    """Convert a request path into the route part of a request ID."""
+    return path.translate(_ROUTE_TRANSLATION).strip("_") or "root"
+
+
+class _LogWriter:
+    """Background writer that keeps debug log file I/O off the request path.
+
+    Entries are queued by the middleware and appended as JSON lines to an
+    hourly file (``debug-YYYYMMDD-HH.jsonl``) by a single task, which hands
+    each batch to a worker thread and flushes once per batch. ``close()``
+    drains the queue and closes the current file.
+    """
+
+    def __init__(self, log_dir: Path) -> None:
+        self._log_dir = log_dir
+        # None is the shutdown sentinel queued by close()
+        self._queue: asyncio.Queue[dict[str, Any] | None] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+        self._fp: BinaryIO | None = None
+        self._hour = ""
+
+    def submit(self, log_entry: dict[str, Any]) -> None:
+        """Queue a log entry for writing, starting the writer task if needed."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._queue.put_nowait(log_entry)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            entries = [log_entry for log_entry in batch if log_entry is not None]
+            # Response headers are mutable (aiohttp still adds to them while
+            # sending), so snapshot them here on the loop, after the response
+            # has been handed back, rather than in the worker thread.
+            for log_entry in entries:
+                response_data = log_entry.get("response")
+                if response_data is not None:
+                    response_data["headers"] = dict(response_data["headers"])
+            if entries:
+                await asyncio.to_thread(self._write_batch, entries)
+            if len(entries) < len(batch):
+                return
+
+    async def close(self) -> None:
+        """Write out queued entries, stop the writer task and close the log file."""
+        if self._task is not None and not self._task.done():
+            self._queue.put_nowait(None)
+            await self._task
+        self._task = None
+        if self._fp is not None:
+            await asyncio.to_thread(self._fp.close)
+            self._fp = None
+
+    def _open_for_hour(self) -> BinaryIO:
+        """Return the file for the current hour, rotating if the hour changed."""
+        hour = time.strftime("%Y%m%d-%H")
+        if self._fp is None or hour != self._hour:
+            if self._fp is not None:
+                self._fp.close()
+            self._fp = open(  # noqa: SIM115
+                self._log_dir / f"debug-{hour}.jsonl", "ab", buffering=_WRITE_BUFFER_SIZE
+            )
+            self._hour = hour
+        return self._fp
+
+    def _encode_entry(self, log_entry: dict[str, Any]) -> bytes:
+        """Encode one log entry, replacing a body orjson cannot serialize.
+
+        Request bodies are parsed with orjson.loads, which accepts deeper
+        nesting than orjson.dumps will write back out.
+        """
+        try:
+            return orjson.dumps(log_entry, default=_json_default, option=_DUMP_OPTIONS)
+        except (TypeError, orjson.JSONEncodeError) as e:
+            logger.error(f"Failed to encode debug log entry {log_entry.get('request_id')}: {e}")
+        fallback = {**log_entry, "request": {**log_entry["request"], "body": _UNSERIALIZABLE}}
+        return orjson.dumps(fallback, default=_json_default, option=_DUMP_OPTIONS)
+
+    def _write_batch(self, entries: list[dict[str, Any]]) -> None:
+        """Append a batch of log entries (runs in a worker thread)."""
+        data = b"".join(self._encode_entry(log_entry) for log_entry in entries)
+        try:
+            fp = self._open_for_hour()
+            fp.write(data)
+            fp.flush()
+        except OSError as e:
+            logger.error(f"Failed to write debug logs to {self._log_dir}: {e}")
+
+
+def create_debug_logger_middleware(app: web.Application | None = None) -> _MiddlewareType:
     """Create the debug logger middleware.
 
+    Args:
+        app: Application the middleware is installed on. When given, queued
+            log entries are written out and the log file is closed on the
+            app's cleanup.
+
     Returns:
         Middleware function (or passthrough if debug logging disabled)
     """
+    settings = get_settings()
     if not settings.debug_logging:
         # Return a passthrough middleware
         @web.middleware
@@ -39,51 +161,70 @@ def create_debug_logger_middleware() -> _MiddlewareType:
     # Ensure debug logs directory exists
     log_dir = Path(settings.debug_logs_dir)
     log_dir.mkdir(parents=True, exist_ok=True)
+    log_success = settings.debug_log_success
+    max_body = settings.debug_log_max_body
+    writer = _LogWriter(log_dir)
+
+    if app is not None:
+
+        async def close_writer(_app: web.Application) -> None:
+            await writer.close()
+
+        app.on_cleanup.append(close_writer)
 
     @web.middleware
     async def debug_logger_middleware(
         request: web.Request,
         handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
     ) -> web.StreamResponse:
-        """Log request and response details to individual JSON files."""
+        """Log request and response details to the hourly JSONL debug log."""
         # Generate request ID
-        timestamp = int(time.time() * 1000)
-        route = request.path.replace("/", "_").strip("_") or "root"
-        request_id = f"{timestamp}_{route}"
+        timestamp = time.time_ns() // 1_000_000
+        request_id = f"{timestamp}_{_route_name(request.path)}"
 
         # Extract serial if available
         serial = extract_serial_from_request(request)
 
-        # Capture request details
-        try:
-            request_body = await request.text()
+        # Capture request details (only buffer small JSON bodies)
+        request_body: Any = None
+        request_json = None
+        content_type = request.content_type
+        content_length = request.content_length
+        # Chunked bodies have no Content-Length, so their size is unknown up front
+        if "json" in content_type and content_length is not None and content_length <= max_body:
             try:
-                request_json = json.loads(request_body) if request_body else None
-            except json.JSONDecodeError:
-                request_json = None
-        except Exception:
-            request_body = None
-            request_json = None
+                request_body = await request.text()
+                try:
+                    request_json = orjson.loads(request_body) if request_body else None
+                except orjson.JSONDecodeError:
+                    request_json = None
+            except Exception:
+                request_body = None
+        elif request.body_exists:
+            request_body = {"content_type": content_type, "length": content_length}
 
         request_data = {
             "method": request.method,
             "path": request.path,
-            "query": dict(request.query),
-            "headers": dict(request.headers),
+            "query": request.query,
+            "headers": request.headers,
             "body": request_json or request_body,
             "serial": serial,
         }
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             response = await handler(request)
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
+
+            if not log_success and 200 <= response.status < 300:
+                return response
 
-            # Capture response details
+            # Capture response details (headers are copied by the writer)
             response_data = {
                 "status": response.status,
-                "headers": dict(response.headers),
+                "headers": response.headers,
                 "elapsed_ms": round(elapsed * 1000, 2),
             }
 
@@ -95,9 +236,7 @@ def create_debug_logger_middleware() -> _MiddlewareType:
                 "response": response_data,
             }
 
-            log_file = log_dir / f"{request_id}.json"
-            with open(log_file, "w") as f:
-                json.dump(log_entry, f, indent=2, default=str)
+            writer.submit(log_entry)
 
             logger.debug(
                 f"[{request_id}] {request.method} {request.path} -> {response.status} "
@@ -107,7 +246,7 @@ def create_debug_logger_middleware() -> _MiddlewareType:
             return response
 
         except Exception as e:
-            elapsed = time.time() - start_time
+            elapsed = time.perf_counter() - start_time
 
             # Log error
             log_entry = {
@@ -121,9 +260,7 @@ def create_debug_logger_middleware() -> _MiddlewareType:
                 },
             }
 
-            log_file = log_dir / f"{request_id}_error.json"
-            with open(log_file, "w") as f:
-                json.dump(log_entry, f, indent=2, default=str)
+            writer.submit(log_entry)
 
             logger.error(f"[{request_id}] {request.method} {request.path} -> ERROR: {e}")
             raise
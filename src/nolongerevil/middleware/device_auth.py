@@ -14,7 +14,7 @@ from collections.abc import Awaitable, Callable
 
 from aiohttp import web
 
-from nolongerevil.config.environment import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.serial_parser import extract_serial_from_request
 from nolongerevil.services.sqlmodel_service import SQLModelService
@@ -50,7 +50,7 @@ def create_device_auth_middleware() -> Callable[
         handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
     ) -> web.StreamResponse:
         # Open mode: skip all auth checks, treat every device as paired
-        if not settings.require_device_pairing:
+        if not get_settings().require_device_pairing:
             request["device_auth_tier"] = TIER_PAIRED
             return await handler(request)
 
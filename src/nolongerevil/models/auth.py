@@ -1,6 +1,8 @@
 """Authentication-related SQLModel models."""
 
-from sqlalchemy import Column, Index, Text
+from typing import Any
+
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, SQLModel
 
 
@@ -14,12 +16,10 @@ class APIKeyModel(SQLModel, table=True):
     keyPreview: str
     userId: str
     name: str
-    permissions: str = Field(sa_column=Column(Text))  # JSON as text
+    permissions: dict[str, Any] = Field(sa_column=Column(JSON))
     createdAt: int  # Millisecond timestamp
     expiresAt: int | None = None  # Millisecond timestamp
     lastUsedAt: int | None = None  # Millisecond timestamp
 
-    __table_args__ = (
-        Index("idx_apiKeys_userId", "userId"),
-        Index("idx_apiKeys_keyHash", "keyHash"),
-    )
+    # keyHash is indexed by its unique constraint
+    __table_args__ = (Index("idx_apiKeys_userId", "userId"),)
@@ -1,6 +1,6 @@
 """Converters between dataclasses and SQLModel models."""
 
-import json
+from collections.abc import Iterable
 from datetime import datetime
 
 from nolongerevil.lib.types import (
@@ -34,7 +34,7 @@ def device_object_to_model(obj: DeviceObject) -> DeviceObjectModel:
         object_key=obj.object_key,
         object_revision=obj.object_revision,
         object_timestamp=obj.object_timestamp,
-        value=json.dumps(obj.value),
+        value=obj.value,
         updatedAt=timestamp_to_ms(obj.updated_at) or now_ms(),
     )
 
@@ -46,11 +46,32 @@ def model_to_device_object(model: DeviceObjectModel) -> DeviceObject:
         object_key=model.object_key,
         object_revision=model.object_revision,
         object_timestamp=model.object_timestamp,
-        value=json.loads(model.value),
+        value=model.value,
         updated_at=ms_to_timestamp(model.updatedAt) or datetime.now(),
     )
 
 
+def models_to_device_objects(models: Iterable[DeviceObjectModel]) -> list[DeviceObject]:
+    """Convert a batch of SQLModel rows to DeviceObject dataclasses.
+
+    Equivalent to mapping ``model_to_device_object`` over the rows, but with the
+    per-row helpers bound to locals for the list endpoints.
+    """
+    to_datetime = ms_to_timestamp
+    now = datetime.now
+    return [
+        DeviceObject(
+            serial=model.serial,
+            object_key=model.object_key,
+            object_revision=model.object_revision,
+            object_timestamp=model.object_timestamp,
+            value=model.value,
+            updated_at=to_datetime(model.updatedAt) or now(),
+        )
+        for model in models
+    ]
+
+
 # User Info Converters
 
 
@@ -129,7 +150,7 @@ def weather_data_to_model(weather: WeatherData) -> WeatherDataModel:
         postalCode=weather.postal_code,
         country=weather.country,
         fetchedAt=timestamp_to_ms(weather.fetched_at) or now_ms(),
-        data=json.dumps(weather.data),
+        data=weather.data,
     )
 
 
@@ -139,7 +160,7 @@ def model_to_weather_data(model: WeatherDataModel) -> WeatherData:
         postal_code=model.postalCode,
         country=model.country,
         fetched_at=ms_to_timestamp(model.fetchedAt) or datetime.now(),
-        data=json.loads(model.data),
+        data=model.data,
     )
 
 
@@ -148,19 +169,17 @@ def model_to_weather_data(model: WeatherDataModel) -> WeatherData:
 
 def api_key_to_model(api_key: APIKey) -> APIKeyModel:
     """Convert APIKey dataclass to SQLModel."""
-    permissions_json = json.dumps(
-        {
-            "devices": api_key.permissions.devices,
-            "scopes": api_key.permissions.scopes,
-        }
-    )
+    permissions = {
+        "devices": api_key.permissions.devices,
+        "scopes": api_key.permissions.scopes,
+    }
     return APIKeyModel(
         id=int(api_key.id) if api_key.id else None,
         keyHash=api_key.key_hash,
         keyPreview=api_key.key_preview,
         userId=api_key.user_id,
         name=api_key.name,
-        permissions=permissions_json,
+        permissions=permissions,
         createdAt=timestamp_to_ms(api_key.created_at) or now_ms(),
         expiresAt=timestamp_to_ms(api_key.expires_at),
         lastUsedAt=timestamp_to_ms(api_key.last_used_at),
@@ -169,7 +188,7 @@ def api_key_to_model(api_key: APIKey) -> APIKeyModel:
 
 def model_to_api_key(model: APIKeyModel) -> APIKey:
     """Convert SQLModel to APIKey dataclass."""
-    permissions_data = json.loads(model.permissions)
+    permissions_data = model.permissions
     return APIKey(
         id=str(model.id),
         key_hash=model.keyHash,
@@ -188,6 +207,9 @@ def model_to_api_key(model: APIKeyModel) -> APIKey:
 
 # Device Share Converters
 
+_SHARE_PERMISSIONS = {permission.value: permission for permission in DeviceSharePermission}
+_INVITE_STATUSES = {status.value: status for status in DeviceShareInviteStatus}
+
 
 def device_share_to_model(share: DeviceShare) -> DeviceShareModel:
     """Convert DeviceShare dataclass to SQLModel."""
@@ -206,7 +228,7 @@ def model_to_device_share(model: DeviceShareModel) -> DeviceShare:
         owner_id=model.ownerId,
         shared_with_user_id=model.sharedWithUserId,
         serial=model.serial,
-        permissions=DeviceSharePermission(model.permissions),
+        permissions=_SHARE_PERMISSIONS[model.permissions],
         created_at=ms_to_timestamp(model.createdAt) or datetime.now(),
     )
 
@@ -237,8 +259,8 @@ def model_to_device_share_invite(model: DeviceShareInviteModel) -> DeviceShareIn
         owner_id=model.ownerId,
         email=model.email,
         serial=model.serial,
-        permissions=DeviceSharePermission(model.permissions),
-        status=DeviceShareInviteStatus(model.status),
+        permissions=_SHARE_PERMISSIONS[model.permissions],
+        status=_INVITE_STATUSES[model.status],
         invited_at=ms_to_timestamp(model.invitedAt) or datetime.now(),
         expires_at=ms_to_timestamp(model.expiresAt) or datetime.now(),
         accepted_at=ms_to_timestamp(model.acceptedAt),
@@ -255,7 +277,7 @@ def integration_config_to_model(integration: IntegrationConfig) -> IntegrationCo
         userId=integration.user_id,
         type=integration.type,
         enabled=1 if integration.enabled else 0,
-        config=json.dumps(integration.config),
+        config=integration.config,
         createdAt=timestamp_to_ms(integration.created_at) or now_ms(),
         updatedAt=timestamp_to_ms(integration.updated_at) or now_ms(),
     )
@@ -267,7 +289,7 @@ def model_to_integration_config(model: IntegrationConfigModel) -> IntegrationCon
         user_id=model.userId,
         type=model.type,
         enabled=bool(model.enabled),
-        config=json.loads(model.config),
+        config=model.config,
         created_at=ms_to_timestamp(model.createdAt) or datetime.now(),
         updated_at=ms_to_timestamp(model.updatedAt) or datetime.now(),
     )
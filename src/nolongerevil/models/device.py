@@ -1,6 +1,8 @@
 """Device-related SQLModel models."""
 
-from sqlalchemy import Column, Index, Text
+from typing import Any
+
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, SQLModel
 
 
@@ -9,16 +11,14 @@ class DeviceObjectModel(SQLModel, table=True):
 
     __tablename__ = "states"
 
-    # Composite primary key (serial, object_key)
+    # Composite primary key (serial, object_key); also serves serial-only lookups
     serial: str = Field(primary_key=True)
     object_key: str = Field(primary_key=True)
     object_revision: int
     object_timestamp: int
-    value: str = Field(sa_column=Column(Text))  # JSON stored as text
+    value: dict[str, Any] = Field(sa_column=Column(JSON))
     updatedAt: int  # Millisecond timestamp
 
-    __table_args__ = (Index("idx_states_serial", "serial"),)
-
 
 class SessionModel(SQLModel, table=True):
     """Device connection session stored in the 'sessions' table."""
@@ -32,7 +32,7 @@ class SessionModel(SQLModel, table=True):
     lastActivity: int  # Millisecond timestamp
     open: int  # Boolean as integer (0/1)
     client: str | None = None
-    meta: str | None = Field(default=None, sa_column=Column(Text))  # JSON as text
+    meta: dict[str, Any] | None = Field(default=None, sa_column=Column(JSON(none_as_null=True)))
 
     __table_args__ = (Index("idx_sessions_serial", "serial"),)
 
@@ -48,10 +48,7 @@ class LogModel(SQLModel, table=True):
     ts: int  # Millisecond timestamp
     route: str
     serial: str | None = None
-    req: str = Field(sa_column=Column(Text))  # JSON as text
-    res: str = Field(sa_column=Column(Text))  # JSON as text
+    req: dict[str, Any] = Field(sa_column=Column(JSON))
+    res: dict[str, Any] = Field(sa_column=Column(JSON))
 
-    __table_args__ = (
-        Index("idx_logs_serial", "serial"),
-        Index("idx_logs_ts", "ts"),
-    )
+    __table_args__ = (Index("idx_logs_serial_ts", "serial", "ts"),)
@@ -1,6 +1,8 @@
 """Integration and weather-related SQLModel models."""
 
-from sqlalchemy import Column, Index, Text
+from typing import Any
+
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, SQLModel
 
 
@@ -12,7 +14,7 @@ class IntegrationConfigModel(SQLModel, table=True):
     userId: str = Field(primary_key=True)
     type: str = Field(primary_key=True)
     enabled: int  # Boolean as integer (0/1)
-    config: str = Field(sa_column=Column(Text))  # JSON as text
+    config: dict[str, Any] = Field(sa_column=Column(JSON))
     createdAt: int  # Millisecond timestamp
     updatedAt: int  # Millisecond timestamp
 
@@ -27,4 +29,4 @@ class WeatherDataModel(SQLModel, table=True):
     postalCode: str = Field(primary_key=True)
     country: str = Field(primary_key=True)
     fetchedAt: int  # Millisecond timestamp
-    data: str = Field(sa_column=Column(Text))  # JSON as text
+    data: dict[str, Any] = Field(sa_column=Column(JSON))
@@ -5,7 +5,7 @@ Commands are dispatched through execute_command(), which:
 2. Calls the handler to validate input and produce a value dict
 3. Routes the value to the correct bucket via COMMAND_OBJECT_KEYS
 4. Merges into server state (or replaces, for schedules)
-5. Pushes to the device via subscription_manager.notify_all_subscribers()
+5. Pushes to the device via subscription_manager.notify_subscribers_with_objects()
 
 Supported commands:
 - set_temperature:    Target temp (single or high/low range) → shared bucket
@@ -549,7 +549,7 @@ async def execute_command(
         )
 
     # Notify subscribers
-    await subscription_manager.notify_all_subscribers(serial, [updated_obj])
+    await subscription_manager.notify_subscribers_with_objects(serial, [updated_obj])
 
     logger.info(f"Command {command} executed for device {serial}")
 
@@ -172,7 +172,9 @@ async def handle_register(request: web.Request) -> web.Response:
         logger.info(f"Created/updated structure bucket {structure_key} for {serial}")
 
         # Push both to any held subscribe connections
-        notified = await subscription_manager.notify_all_subscribers(serial, objects_to_push)
+        notified = await subscription_manager.notify_subscribers_with_objects(
+            serial, objects_to_push
+        )
         if notified:
             logger.info(f"Pushed user + structure buckets to {notified} subscriber(s) for {serial}")
         else:
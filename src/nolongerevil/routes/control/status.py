@@ -8,7 +8,7 @@ from typing import Any
 
 from aiohttp import web
 
-from nolongerevil.config.environment import settings
+from nolongerevil.config import get_settings
 from nolongerevil.integrations.mqtt.helpers import get_device_name
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.types import DeviceObject
@@ -170,7 +170,7 @@ async def handle_devices(request: web.Request) -> web.Response:
     subscription_manager: SubscriptionManager = request.app["subscription_manager"]
     storage: SQLModelService | None = request.app.get("storage")
 
-    if storage and settings.require_device_pairing:
+    if storage and get_settings().require_device_pairing:
         # Only show devices that have been claimed/registered via entry key
         serials = await storage.get_all_registered_serials()
     else:
@@ -263,7 +263,7 @@ async def handle_notify_device(request: web.Request) -> web.Response:
         )
 
     # Notify all subscribers with current state
-    notified = await subscription_manager.notify_all_subscribers(serial, objects)
+    notified = await subscription_manager.notify_subscribers_with_objects(serial, objects)
 
     logger.info(f"Manual notification for device {serial}: {notified} subscribers notified")
 
@@ -347,7 +347,7 @@ async def handle_dismiss_pairing(request: web.Request) -> web.Response:
         )
 
         # Notify all subscribers with the dismissed dialog
-        await subscription_manager.notify_all_subscribers(serial, [dismissed_dialog])
+        await subscription_manager.notify_subscribers_with_objects(serial, [dismissed_dialog])
 
         return web.json_response(
             {
@@ -1,14 +1,44 @@
 """Nest entry endpoint - service discovery."""
 
+from functools import lru_cache
+
+import orjson
 from aiohttp import web
 
-from nolongerevil.config import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.serial_parser import extract_serial_from_request
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _entry_response_body(origin: str) -> bytes:
+    """Build the encoded service discovery response for an API origin.
+
+    Args:
+        origin: API origin (with port) the device should connect to
+
+    Returns:
+        JSON-encoded response body
+    """
+    return orjson.dumps(
+        {
+            "czfe_url": f"{origin}/nest/transport",
+            "transport_url": f"{origin}/nest/transport",
+            "direct_transport_url": f"{origin}/nest/transport",
+            "passphrase_url": f"{origin}/nest/passphrase",
+            "ping_url": f"{origin}/nest/transport",
+            "pro_info_url": f"{origin}/nest/pro_info",
+            "weather_url": f"{origin}/nest/weather/v1?query=",
+            "upload_url": f"{origin}/nest/upload",
+            "software_update_url": "",
+            "server_version": "1.0.0",
+            "tier_name": "local",
+        }
+    )
+
+
 async def handle_entry(request: web.Request) -> web.Response:
     """Handle Nest service discovery request.
 
@@ -25,7 +55,7 @@ async def handle_entry(request: web.Request) -> web.Response:
         JSON response with service URLs
     """
     serial = extract_serial_from_request(request)
-    origin = settings.api_origin_with_port
+    origin = get_settings().api_origin_with_port
 
     # Parse entry request fields (form-urlencoded per spec)
     entry_info = {}
@@ -44,27 +74,14 @@ async def handle_entry(request: web.Request) -> web.Response:
         except Exception as e:
             logger.debug(f"Could not parse entry form data: {e}")
 
-    # Build service URLs
-    response_data = {
-        "czfe_url": f"{origin}/nest/transport",
-        "transport_url": f"{origin}/nest/transport",
-        "direct_transport_url": f"{origin}/nest/transport",
-        "passphrase_url": f"{origin}/nest/passphrase",
-        "ping_url": f"{origin}/nest/transport",
-        "pro_info_url": f"{origin}/nest/pro_info",
-        "weather_url": f"{origin}/nest/weather/v1?query=",
-        "upload_url": f"{origin}/nest/upload",
-        "software_update_url": "",
-        "server_version": "1.0.0",
-        "tier_name": "local",
-    }
-
     if entry_info:
         logger.debug(f"Entry request from {serial or request.remote}: {entry_info}")
     else:
         logger.debug(f"Entry request from {serial or request.remote}")
 
-    return web.json_response(response_data)
+    return web.Response(
+        body=_entry_response_body(origin), content_type="application/json", charset="utf-8"
+    )
 
 
 def create_entry_routes(app: web.Application) -> None:
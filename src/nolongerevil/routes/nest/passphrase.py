@@ -5,7 +5,7 @@ from datetime import UTC, datetime
 
 from aiohttp import web
 
-from nolongerevil.config import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.serial_parser import extract_serial_from_request
 from nolongerevil.lib.types import DeviceObject
@@ -98,7 +98,7 @@ async def handle_passphrase(request: web.Request) -> web.Response:
         )
 
     state_service: DeviceStateService = request.app["state_service"]
-    ttl = settings.entry_key_ttl_seconds
+    ttl = get_settings().entry_key_ttl_seconds
 
     # Check for existing unexpired unclaimed key first
     existing_key = await state_service.storage.get_latest_entry_key_by_serial(serial)
@@ -1,11 +1,40 @@
 """Nest pro_info endpoint - installer information lookup."""
 
+from functools import lru_cache
+from hashlib import blake2b
+
+import orjson
 from aiohttp import web
 
 from nolongerevil.lib.logger import get_logger
 
 logger = get_logger(__name__)
 
+# The response only depends on the code, so devices and proxies may keep it for a day
+PRO_INFO_CACHE_CONTROL = "public, max-age=86400"
+
+
+@lru_cache(maxsize=1024)
+def _pro_info_response(code: str) -> tuple[bytes, str]:
+    """Build the encoded pro info response and its ETag for an installer code.
+
+    Args:
+        code: Pro installer code from the request path
+
+    Returns:
+        Tuple of (JSON-encoded response body, ETag value without quotes)
+    """
+    # Return empty/default pro info
+    body = orjson.dumps(
+        {
+            "pro_id": code,
+            "company_name": "Self-Hosted",
+            "phone": "",
+            "email": "",
+        }
+    )
+    return body, blake2b(body, digest_size=8).hexdigest()
+
 
 async def handle_pro_info(request: web.Request) -> web.Response:
     """Handle installer information lookup request.
@@ -14,20 +43,25 @@ async def handle_pro_info(request: web.Request) -> web.Response:
     Since we're self-hosted, we return a generic response.
 
     Returns:
-        JSON response with installer info (or empty)
+        JSON response with installer info (or empty), or 304 if the
+        client's If-None-Match already matches
     """
     code = request.match_info.get("code", "")
 
     logger.debug(f"Pro info request for code: {code}")
 
-    # Return empty/default pro info
-    return web.json_response(
-        {
-            "pro_id": code,
-            "company_name": "Self-Hosted",
-            "phone": "",
-            "email": "",
-        }
+    body, etag = _pro_info_response(code)
+    headers = {"ETag": f'"{etag}"', "Cache-Control": PRO_INFO_CACHE_CONTROL}
+
+    # If-None-Match uses weak comparison, so W/ tags match too
+    if any(tag.value in (etag, "*") for tag in request.if_none_match or ()):
+        return web.Response(status=304, headers=headers)
+
+    return web.Response(
+        body=body,
+        content_type="application/json",
+        charset="utf-8",
+        headers=headers,
     )
 
 
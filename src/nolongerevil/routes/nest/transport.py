@@ -52,9 +52,10 @@ import time
 from datetime import datetime
 from typing import Any
 
+import orjson
 from aiohttp import web
 
-from nolongerevil.config.environment import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.serial_parser import extract_serial_from_request, extract_weave_device_id
 from nolongerevil.lib.types import DeviceObject
@@ -78,12 +79,15 @@ _structure_sent: set[str] = set()
 # inter-chunk timeout so the connection never idles out on the device side.
 INTER_CHUNK_BATCH_TIMEOUT = 3.0
 
+# Body sent when a subscribe cannot be held open
+EMPTY_OBJECTS_BODY = b'{"objects":[]}'
+
 
 def parse_object_key(object_key: str) -> tuple[str, str]:
     """Parse an object key into type and serial."""
-    parts = object_key.split(".", 1)
-    if len(parts) == 2:
-        return parts[0], parts[1]
+    object_type, sep, serial = object_key.partition(".")
+    if sep:
+        return object_type, serial
     return object_key, ""
 
 
@@ -283,6 +287,7 @@ def _make_response_headers(
                                Use when pushing temperature/mode changes to get
                                immediate device confirmation.
     """
+    settings = get_settings()
     headers = {
         "X-nl-service-timestamp": str(int(time.time() * 1000)),
         "X-nl-suspend-time-max": str(settings.suspend_time_max),
@@ -328,6 +333,7 @@ async def handle_transport_subscribe(request: web.Request) -> web.StreamResponse
     4. On data: send chunk, then batch additional data for up to 3s
     5. On timeout: close connection without sending body (no tickle)
     """
+    settings = get_settings()
     serial = extract_serial_from_request(request)
     if not serial:
         return web.json_response({"error": "Device serial required"}, status=400)
@@ -700,7 +706,7 @@ async def handle_transport_subscribe(request: web.Request) -> web.StreamResponse
     if outdated_objects:
         formatted_objs = [format_object_for_response(obj) for obj in outdated_objects]
         logger.debug(f"Sending {len(outdated_objects)} outdated object(s) immediately for {serial}")
-        body_data = json.dumps({"objects": formatted_objs}).encode("utf-8")
+        body_data = orjson.dumps({"objects": formatted_objs})
         await response.write(body_data)
         await response.write_eof()
         return response
@@ -711,7 +717,7 @@ async def handle_transport_subscribe(request: web.Request) -> web.StreamResponse
     if subscription is None:
         # Too many subscriptions - send empty response and close
         logger.warning(f"Too many subscriptions for {serial}")
-        await response.write(json.dumps({"objects": []}).encode("utf-8"))
+        await response.write(EMPTY_OBJECTS_BODY)
         await response.write_eof()
         return response
 
@@ -720,10 +726,10 @@ async def handle_transport_subscribe(request: web.Request) -> web.StreamResponse
         f"server hold timeout at {settings.connection_hold_timeout:.0f}s (device wakes at {settings.suspend_time_max}s)"
     )
 
-    # Direct queue access - no lookup needed
-    notify_queue = subscription.notify_queue
+    # Bound method on the subscription - no lookup needed
+    next_payload = subscription.next_payload
     data_sent = False
-    changed_objects = None
+    body_bytes = None
 
     try:
         # Wait for data - hold connection until data arrives or device disconnects
@@ -732,32 +738,31 @@ async def handle_transport_subscribe(request: web.Request) -> web.StreamResponse
         try:
             # Use connection_hold_timeout which is > suspend_time_max
             # This ensures we never close before device's wake timer fires
-            changed_objects = await asyncio.wait_for(
-                notify_queue.get(),
+            # Payloads arrive already encoded by the subscription manager
+            body_bytes = await asyncio.wait_for(
+                next_payload(),
                 timeout=settings.connection_hold_timeout,
             )
             # Real data arrived - send it to wake the device
-            body_bytes = json.dumps({"objects": changed_objects}).encode("utf-8")
             await response.write(body_bytes)
             data_sent = True
             total_bytes = len(body_bytes)
             chunk_count = 1
-            changed_objects = None  # written successfully, clear pending ref
+            body_bytes = None  # written successfully, clear pending ref
 
             # Batch loop: hold the connection briefly for additional data.
             # The device resets its 5s closing timer on each chunk, so we can
             # safely wait up to INTER_CHUNK_BATCH_TIMEOUT (3s) between chunks.
             while True:
                 try:
-                    changed_objects = await asyncio.wait_for(
-                        notify_queue.get(),
+                    body_bytes = await asyncio.wait_for(
+                        next_payload(),
                         timeout=INTER_CHUNK_BATCH_TIMEOUT,
                     )
-                    body_bytes = json.dumps({"objects": changed_objects}).encode("utf-8")
                     await response.write(body_bytes)
                     total_bytes += len(body_bytes)
                     chunk_count += 1
-                    changed_objects = None
+                    body_bytes = None
                 except TimeoutError:
                     # No more data within batch window - done
                     break
@@ -782,8 +787,8 @@ async def handle_transport_subscribe(request: web.Request) -> web.StreamResponse
         # Connection closed by device (it went to sleep) - this is normal
         logger.info(f"Subscription {subscription.id}: connection closed ({type(e).__name__}): {e}")
         # Buffer undelivered data so the next subscribe replays it
-        if changed_objects is not None:
-            await subscription_manager.store_pending_push(serial, changed_objects)
+        if body_bytes is not None:
+            await subscription_manager.store_pending_push(serial, body_bytes)
 
     finally:
         logger.debug(f"Removing subscription {subscription.id} for {serial}")
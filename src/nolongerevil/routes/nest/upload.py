@@ -6,13 +6,17 @@ from pathlib import Path
 
 from aiohttp import web
 
-from nolongerevil.config.environment import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.serial_parser import extract_serial_from_request
 
 logger = get_logger(__name__)
 
 LOG_STORAGE_PATH = Path("/app/data/device_logs")
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Every upload gets the same acknowledgement
+_UPLOAD_OK_BODY = b'{"status":"ok"}'
 
 
 async def handle_upload(request: web.Request) -> web.Response:
@@ -24,11 +28,16 @@ async def handle_upload(request: web.Request) -> web.Response:
     serial = extract_serial_from_request(request)
 
     try:
-        data = await request.read()
-        size = len(data)
-        logger.info(f"Received log upload from device {serial or 'unknown'}: {size} bytes")
+        if not get_settings().store_device_logs:
+            # Nothing is kept, so count the body as it streams in instead of buffering it
+            size = 0
+            async for chunk in request.content.iter_chunked(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+            logger.info(f"Received log upload from device {serial or 'unknown'}: {size} bytes")
+        else:
+            data = await request.read()
+            logger.info(f"Received log upload from device {serial or 'unknown'}: {len(data)} bytes")
 
-        if settings.store_device_logs:
             device_dir = LOG_STORAGE_PATH / (serial or "unknown")
             device_dir.mkdir(parents=True, exist_ok=True)
 
@@ -47,7 +56,7 @@ async def handle_upload(request: web.Request) -> web.Response:
     except Exception as e:
         logger.warning(f"Failed to read/store upload data: {e}")
 
-    return web.json_response({"status": "ok"})
+    return web.Response(body=_UPLOAD_OK_BODY, content_type="application/json", charset="utf-8")
 
 
 def create_upload_routes(app: web.Application) -> None:
@@ -1,5 +1,9 @@
 """Nest weather endpoint - weather data with caching."""
 
+import hashlib
+from collections.abc import Mapping
+
+import orjson
 from aiohttp import web
 
 from nolongerevil.lib.logger import get_logger
@@ -7,6 +11,26 @@ from nolongerevil.services.weather_service import WeatherService
 
 logger = get_logger(__name__)
 
+# Query parameters that identify a weather location; anything else (cache
+# busters, tokens) is ignored when building the cache key
+WEATHER_KEY_PARAMS = frozenset({"postal_code", "country", "query", "lat", "lon"})
+
+
+def weather_cache_key(query: Mapping[str, str]) -> str | None:
+    """Build a canonical cache key from the location parameters of a request.
+
+    Args:
+        query: Request query parameters
+
+    Returns:
+        Hex digest of the sorted location parameters, or None if there are none
+    """
+    items = sorted((k, v) for k, v in query.items() if k in WEATHER_KEY_PARAMS)
+    if not items:
+        return None
+    canonical = "&".join(f"{k}={v}" for k, v in items)
+    return hashlib.blake2b(canonical.encode(), digest_size=16).hexdigest()
+
 
 async def handle_weather(request: web.Request) -> web.Response:
     """Handle weather data request.
@@ -33,10 +57,15 @@ async def handle_weather(request: web.Request) -> web.Response:
         postal_code=postal_code,
         country=country,
         query_string=query_string,
+        cache_key=weather_cache_key(request.query),
     )
 
     if weather_data:
-        return web.json_response(weather_data)
+        return web.Response(
+            body=orjson.dumps(weather_data),
+            content_type="application/json",
+            charset="utf-8",
+        )
     else:
         logger.warning("Weather service unavailable")
         return web.json_response(
@@ -1,6 +1,7 @@
 """Abstract base class for device state persistence."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from typing import Any
 
 from nolongerevil.lib.types import (
@@ -50,6 +51,15 @@ class AbstractDeviceStateManager(ABC):
         """Insert or update a device object."""
         pass
 
+    async def upsert_objects(self, objs: Sequence[DeviceObject]) -> None:
+        """Insert or update several device objects.
+
+        Backends that can write a batch in one statement should override this;
+        the default upserts one object at a time.
+        """
+        for obj in objs:
+            await self.upsert_object(obj)
+
     @abstractmethod
     async def delete_object(self, serial: str, object_key: str) -> bool:
         """Delete a device object."""
@@ -2,8 +2,12 @@
 
 import asyncio
 import contextlib
+import heapq
+import time
+from collections.abc import Callable, Coroutine
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 from nolongerevil.lib.logger import get_logger
@@ -17,17 +21,30 @@ logger = get_logger(__name__)
 # Default timeout values (in seconds)
 DEFAULT_DEVICE_TIMEOUT = 300  # 5 minutes
 DEFAULT_CHECK_INTERVAL = 30  # 30 seconds
+MIN_CHECK_INTERVAL = 1.0  # Floor for the deadline-driven sleep
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceStatus:
     """Tracking data for a device's availability."""
 
     serial: str
-    last_seen: datetime = field(default_factory=datetime.now)
+    last_seen: float = field(default_factory=time.monotonic)  # time.monotonic() seconds
     is_available: bool = True
 
 
+def _monotonic_to_datetime(timestamp: float) -> datetime:
+    """Convert a time.monotonic() reading to wall-clock time.
+
+    Args:
+        timestamp: Monotonic clock reading
+
+    Returns:
+        Corresponding local datetime
+    """
+    return datetime.now() - timedelta(seconds=time.monotonic() - timestamp)
+
+
 class DeviceAvailability:
     """Watchdog service for tracking device availability.
 
@@ -50,10 +67,17 @@ class DeviceAvailability:
         """
         self._subscription_manager = subscription_manager
         self._timeout = timedelta(seconds=timeout_seconds)
+        self._timeout_seconds = float(timeout_seconds)
         self._check_interval = check_interval_seconds
         self._devices: dict[str, DeviceStatus] = {}
+        # (deadline, serial) min-heap with one entry per available device; the
+        # deadline is refreshed lazily from last_seen when the entry comes due
+        self._expiry_heap: list[tuple[float, str]] = []
         self._integration_manager: IntegrationManager | None = None
         self._task: asyncio.Task[None] | None = None
+        self._callback_tasks: set[asyncio.Task[None]] = set()
+        # Latest callback task per device, so callbacks run in the order queued
+        self._device_callbacks: dict[str, asyncio.Task[None]] = {}
         self._running = False
 
     def set_integration_manager(self, manager: "IntegrationManager") -> None:
@@ -75,11 +99,9 @@ class DeviceAvailability:
         """
         for serial in serials:
             if serial not in self._devices:
-                self._devices[serial] = DeviceStatus(
-                    serial=serial,
-                    last_seen=datetime.now(),
-                    is_available=True,
-                )
+                status = DeviceStatus(serial=serial, is_available=True)
+                self._devices[serial] = status
+                self._schedule_expiry(serial, status.last_seen)
         if serials:
             logger.info(f"Initialized availability tracking for {len(serials)} device(s)")
 
@@ -97,13 +119,18 @@ class DeviceAvailability:
         )
 
     async def stop(self) -> None:
-        """Stop the availability monitoring task."""
+        """Stop the availability monitoring task and pending integration callbacks."""
         self._running = False
         if self._task:
             self._task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
             self._task = None
+        for task in self._callback_tasks:
+            task.cancel()
+        await asyncio.gather(*self._callback_tasks, return_exceptions=True)
+        self._callback_tasks.clear()
+        self._device_callbacks.clear()
         logger.info("Device availability monitoring stopped")
 
     async def _monitor_loop(self) -> None:
@@ -111,54 +138,134 @@ class DeviceAvailability:
         while self._running:
             try:
                 await self._check_devices()
-                await asyncio.sleep(self._check_interval)
+                await asyncio.sleep(self._next_check_delay())
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 logger.error(f"Error in availability monitor: {e}")
                 await asyncio.sleep(self._check_interval)
 
+    def _next_check_delay(self) -> float:
+        """Seconds until the next monitor pass.
+
+        Sleeps until the earliest pending deadline, clamped between
+        MIN_CHECK_INTERVAL and the configured check interval. New devices never
+        need an earlier wake-up: their deadline is a full timeout away.
+
+        Returns:
+            Delay in seconds
+        """
+        if not self._expiry_heap:
+            return float(self._check_interval)
+        until_due = self._expiry_heap[0][0] - time.monotonic()
+        return max(MIN_CHECK_INTERVAL, min(float(self._check_interval), until_due))
+
+    def _notify_integrations(
+        self, serial: str, callback: Callable[[str], Coroutine[Any, Any, None]]
+    ) -> None:
+        """Run an integration callback in the background.
+
+        Keeps slow integrations (e.g. MQTT publishes) from stalling the
+        monitor loop or the request that marked the device seen. Callbacks
+        for the same device are chained, so a slow "connected" publish cannot
+        land after the "disconnected" one that followed it.
+
+        Args:
+            serial: Device serial number the callback is for
+            callback: Integration manager method to call with the serial
+        """
+        previous = self._device_callbacks.get(serial)
+        task = asyncio.create_task(self._run_after(previous, callback, serial))
+        self._device_callbacks[serial] = task
+        self._callback_tasks.add(task)
+        task.add_done_callback(partial(self._on_callback_done, serial))
+
+    @staticmethod
+    async def _run_after(
+        previous: asyncio.Task[None] | None,
+        callback: Callable[[str], Coroutine[Any, Any, None]],
+        serial: str,
+    ) -> None:
+        """Wait for a device's previous callback (whatever its outcome), then run callback."""
+        if previous is not None:
+            await asyncio.wait([previous])
+        await callback(serial)
+
+    def _on_callback_done(self, serial: str, task: asyncio.Task[None]) -> None:
+        """Release a finished integration callback and log any failure."""
+        self._callback_tasks.discard(task)
+        if self._device_callbacks.get(serial) is task:
+            del self._device_callbacks[serial]
+        if not task.cancelled() and task.exception():
+            logger.error(f"Integration availability callback failed: {task.exception()}")
+
+    def _schedule_expiry(self, serial: str, last_seen: float) -> None:
+        """Queue a timeout check for a device based on when it was last seen.
+
+        Args:
+            serial: Device serial number
+            last_seen: Monotonic time the device was last seen
+        """
+        heapq.heappush(self._expiry_heap, (last_seen + self._timeout_seconds, serial))
+
     async def _check_devices(self) -> None:
-        """Check all devices for timeout."""
-        now = datetime.now()
-        stale_threshold = now - self._timeout
+        """Check devices whose timeout deadline has passed.
+
+        Only devices at the top of the expiry heap are examined; devices seen
+        since their entry was queued are rescheduled rather than timed out.
+        """
+        now = time.monotonic()
+        heap = self._expiry_heap
+        still_alive: list[str] = []
+
+        while heap and heap[0][0] <= now:
+            _, serial = heapq.heappop(heap)
+            status = self._devices.get(serial)
+            if status is None or not status.is_available:
+                continue
 
-        for serial, status in list(self._devices.items()):
             # Check if device has active subscriptions (heartbeat)
             if self._subscription_manager.has_active_subscription(serial):
                 await self.mark_device_seen(serial)
-                continue
-
-            # Check for timeout
-            if status.is_available and status.last_seen < stale_threshold:
+                still_alive.append(serial)
+            # Seen again since this entry was queued
+            elif status.last_seen + self._timeout_seconds > now:
+                still_alive.append(serial)
+            else:
                 await self._mark_device_unavailable(serial)
 
+        # Reschedule after draining so nothing is popped twice in one pass
+        for serial in still_alive:
+            self._schedule_expiry(serial, self._devices[serial].last_seen)
+
     async def mark_device_seen(self, serial: str) -> None:
         """Mark a device as recently seen.
 
         Args:
             serial: Device serial number
         """
-        now = datetime.now()
+        now = time.monotonic()
+        status = self._devices.get(serial)
 
-        if serial not in self._devices:
+        if status is None:
             self._devices[serial] = DeviceStatus(serial=serial, last_seen=now)
+            self._schedule_expiry(serial, now)
             logger.info(f"Device {serial} is now being tracked")
 
             # Notify integrations of new device
             if self._integration_manager:
-                await self._integration_manager.on_device_connected(serial)
+                self._notify_integrations(serial, self._integration_manager.on_device_connected)
         else:
-            was_available = self._devices[serial].is_available
-            self._devices[serial].last_seen = now
+            status.last_seen = now
 
             # Device came back online
-            if not was_available:
-                self._devices[serial].is_available = True
+            if not status.is_available:
+                status.is_available = True
+                self._schedule_expiry(serial, now)
                 logger.info(f"Device {serial} is now available")
 
                 if self._integration_manager:
-                    await self._integration_manager.on_device_connected(serial)
+                    self._notify_integrations(serial, self._integration_manager.on_device_connected)
 
     async def _mark_device_unavailable(self, serial: str) -> None:
         """Mark a device as unavailable.
@@ -166,15 +273,13 @@ class DeviceAvailability:
         Args:
             serial: Device serial number
         """
-        if serial not in self._devices:
-            return
-
-        if self._devices[serial].is_available:
-            self._devices[serial].is_available = False
+        status = self._devices.get(serial)
+        if status is not None and status.is_available:
+            status.is_available = False
             logger.warning(f"Device {serial} is now unavailable (timeout)")
 
             if self._integration_manager:
-                await self._integration_manager.on_device_disconnected(serial)
+                self._notify_integrations(serial, self._integration_manager.on_device_disconnected)
 
     def is_available(self, serial: str) -> bool:
         """Check if a device is currently available.
@@ -198,7 +303,7 @@ class DeviceAvailability:
             Last seen timestamp or None if never seen
         """
         status = self._devices.get(serial)
-        return status.last_seen if status else None
+        return _monotonic_to_datetime(status.last_seen) if status else None
 
     def get_all_statuses(self) -> dict[str, dict[str, Any]]:
         """Get availability status for all tracked devices.
@@ -209,7 +314,7 @@ class DeviceAvailability:
         return {
             serial: {
                 "is_available": status.is_available,
-                "last_seen": status.last_seen.isoformat(),
+                "last_seen": _monotonic_to_datetime(status.last_seen).isoformat(),
             }
             for serial, status in self._devices.items()
         }
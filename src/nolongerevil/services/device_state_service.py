@@ -242,15 +242,16 @@ class DeviceStateService:
         Returns:
             List of objects that have been updated
         """
-        updates = []
-        device_objects = self._cache.get(serial, {})
-
-        for object_key, last_revision in subscribed_keys.items():
-            obj = device_objects.get(object_key)
-            if obj and obj.object_revision > last_revision:
-                updates.append(obj)
-
-        return updates
+        device_objects = self._cache.get(serial)
+        if not device_objects:
+            return []
+
+        return [
+            obj
+            for object_key, last_revision in subscribed_keys.items()
+            if (obj := device_objects.get(object_key)) is not None
+            and obj.object_revision > last_revision
+        ]
 
     @property
     def storage(self) -> "AbstractDeviceStateManager":
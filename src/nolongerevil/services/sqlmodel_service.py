@@ -1,23 +1,25 @@
 """SQLModel implementation of device state persistence."""
 
 import hashlib
-import json
-import random
+import secrets
 import string
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from sqlalchemy import delete
+import orjson
+from sqlalchemy import delete, or_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlmodel import SQLModel, select
+from sqlmodel import SQLModel, col, select
 
-from nolongerevil.config import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.types import (
     APIKey,
@@ -62,6 +64,7 @@ from nolongerevil.models.converters import (
     model_to_integration_config,
     model_to_user_info,
     model_to_weather_data,
+    models_to_device_objects,
     user_info_to_model,
     weather_data_to_model,
 )
@@ -69,6 +72,28 @@ from nolongerevil.services.abstract_device_state_manager import AbstractDeviceSt
 
 logger = get_logger(__name__)
 
+# Number of distinct entry codes: 3 digits followed by 4 uppercase letters
+_ENTRY_CODE_SPACE = 10**3 * 26**4
+
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON columns with orjson (SQLAlchemy expects a str)."""
+    return orjson.dumps(value).decode()
+
+
+def _generate_entry_code() -> str:
+    """Generate a pairing code of 3 digits followed by 4 uppercase letters.
+
+    Draws a single random integer covering every possible code and splits it
+    into characters, rather than drawing each character separately.
+    """
+    value = secrets.randbelow(_ENTRY_CODE_SPACE)
+    chars = []
+    for _ in range(4):
+        value, index = divmod(value, 26)
+        chars.append(string.ascii_uppercase[index])
+    return f"{value:03d}{''.join(reversed(chars))}"
+
 
 class SQLModelService(AbstractDeviceStateManager):
     """SQLModel implementation of device state persistence."""
@@ -83,8 +108,9 @@ class SQLModelService(AbstractDeviceStateManager):
             self.db_url = db_url
         else:
             # Ensure directory exists
-            Path(settings.sqlite3_db_path).parent.mkdir(parents=True, exist_ok=True)
-            self.db_url = f"sqlite+aiosqlite:///{settings.sqlite3_db_path}"
+            db_path = get_settings().sqlite3_db_path
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self.db_url = f"sqlite+aiosqlite:///{db_path}"
 
         self.engine: AsyncEngine | None = None
         self.__session_maker: async_sessionmaker[AsyncSession] | None = None
@@ -102,6 +128,8 @@ class SQLModelService(AbstractDeviceStateManager):
             self.db_url,
             echo=False,
             future=True,
+            json_serializer=_json_serializer,
+            json_deserializer=orjson.loads,
         )
 
         self.__session_maker = async_sessionmaker(
@@ -145,38 +173,39 @@ class SQLModelService(AbstractDeviceStateManager):
                 select(DeviceObjectModel).where(DeviceObjectModel.serial == serial)
             )
             models = result.scalars().all()
-            return [model_to_device_object(model) for model in models]
+            return models_to_device_objects(models)
 
     async def get_all_objects(self) -> list[DeviceObject]:
         """Get all device objects."""
         async with self._session_maker() as session:
             result = await session.execute(select(DeviceObjectModel))
             models = result.scalars().all()
-            return [model_to_device_object(model) for model in models]
+            return models_to_device_objects(models)
 
     async def upsert_object(self, obj: DeviceObject) -> None:
         """Insert or update a device object."""
-        async with self._session_maker() as session:
-            # Try to find existing
-            result = await session.execute(
-                select(DeviceObjectModel).where(
-                    DeviceObjectModel.serial == obj.serial,
-                    DeviceObjectModel.object_key == obj.object_key,
-                )
-            )
-            existing = result.scalar_one_or_none()
+        await self.upsert_objects([obj])
 
-            if existing:
-                # Update existing
-                existing.object_revision = obj.object_revision
-                existing.object_timestamp = obj.object_timestamp
-                existing.value = json.dumps(obj.value)
-                existing.updatedAt = now_ms()
-            else:
-                # Insert new
-                model = device_object_to_model(obj)
-                session.add(model)
+    async def upsert_objects(self, objs: Sequence[DeviceObject]) -> None:
+        """Insert or update several device objects in one statement and commit."""
+        if not objs:
+            return
 
+        stmt = sqlite_insert(DeviceObjectModel).values(
+            [device_object_to_model(obj).model_dump() for obj in objs]
+        )
+        # On conflict, overwrite revision, timestamp and value and refresh updatedAt
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["serial", "object_key"],
+            set_={
+                "object_revision": stmt.excluded.object_revision,
+                "object_timestamp": stmt.excluded.object_timestamp,
+                "value": stmt.excluded.value,
+                "updatedAt": now_ms(),
+            },
+        )
+        async with self._session_maker() as session:
+            await session.execute(stmt)
             await session.commit()
 
     async def delete_object(self, serial: str, object_key: str) -> bool:
@@ -263,21 +292,18 @@ class SQLModelService(AbstractDeviceStateManager):
         """Claim an entry key for a user."""
         now = now_ms()
         async with self._session_maker() as session:
+            # Single conditional UPDATE so two concurrent claims cannot both succeed
             result = await session.execute(
-                select(EntryKeyModel).where(
-                    EntryKeyModel.code == code,
-                    EntryKeyModel.claimedBy.is_(None),
-                    EntryKeyModel.expiresAt > now,
+                update(EntryKeyModel)
+                .where(
+                    col(EntryKeyModel.code) == code,
+                    col(EntryKeyModel.claimedBy).is_(None),
+                    col(EntryKeyModel.expiresAt) > now,
                 )
+                .values(claimedBy=user_id, claimedAt=now)
             )
-            model = result.scalar_one_or_none()
-
-            if model:
-                model.claimedBy = user_id
-                model.claimedAt = now
-                await session.commit()
-                return True
-            return False
+            await session.commit()
+            return result.rowcount > 0
 
     # User operations
 
@@ -392,25 +418,14 @@ class SQLModelService(AbstractDeviceStateManager):
             return model_to_weather_data(model) if model else None
 
     async def cache_weather(self, weather: WeatherData) -> None:
-        """Cache weather data.
-
-        Note: Deletes all existing entries and inserts a new one to avoid duplicates.
-        """
-        from sqlalchemy import delete
-
+        """Cache weather data, replacing any entry for the same postal code/country."""
+        stmt = sqlite_insert(WeatherDataModel).values(weather_data_to_model(weather).model_dump())
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["postalCode", "country"],
+            set_={"fetchedAt": stmt.excluded.fetchedAt, "data": stmt.excluded.data},
+        )
         async with self._session_maker() as session:
-            # Delete all existing entries for this postal_code/country
-            await session.execute(
-                delete(WeatherDataModel).where(
-                    WeatherDataModel.postalCode == weather.postal_code,
-                    WeatherDataModel.country == weather.country,
-                )
-            )
-
-            # Insert new entry
-            model = weather_data_to_model(weather)
-            session.add(model)
-
+            await session.execute(stmt)
             await session.commit()
 
     # API key operations
@@ -594,7 +609,7 @@ class SQLModelService(AbstractDeviceStateManager):
 
             if existing:
                 existing.enabled = 1 if integration.enabled else 0
-                existing.config = json.dumps(integration.config)
+                existing.config = integration.config
                 existing.updatedAt = timestamp_to_ms(integration.updated_at) or now_ms()
             else:
                 model = integration_config_to_model(integration)
@@ -652,7 +667,7 @@ class SQLModelService(AbstractDeviceStateManager):
                     lastActivity=now,
                     open=1,
                     client=client,
-                    meta=json.dumps(meta) if meta else None,
+                    meta=meta or None,
                 )
                 session_obj.add(model)
 
@@ -703,8 +718,8 @@ class SQLModelService(AbstractDeviceStateManager):
                 ts=now_ms(),
                 route=route,
                 serial=serial,
-                req=json.dumps(request_data),
-                res=json.dumps(response_data),
+                req=request_data,
+                res=response_data,
             )
             session.add(model)
             await session.commit()
@@ -732,9 +747,7 @@ class SQLModelService(AbstractDeviceStateManager):
                 # Generate unique code
                 code = None
                 for _ in range(20):
-                    digits = "".join(random.choices(string.digits, k=3))
-                    letters = "".join(random.choices(string.ascii_uppercase, k=4))
-                    candidate = f"{digits}{letters}"
+                    candidate = _generate_entry_code()
 
                     # Check if code already exists
                     result = await session.execute(
@@ -974,34 +987,39 @@ class SQLModelService(AbstractDeviceStateManager):
                 )
             )
             models = result.scalars().all()
-            return [
-                {"userId": model.userId, "config": json.loads(model.config or "{}")}
-                for model in models
-            ]
+            return [{"userId": model.userId, "config": model.config or {}} for model in models]
 
     async def validate_api_key(self, key: str) -> dict[str, Any] | None:
         """Validate API key for authentication."""
         try:
-            key_hash = hash_api_key(key)
-            api_key = await self.get_api_key_by_hash(key_hash)
-
-            if not api_key:
-                return None
+            now = now_ms()
+            # Look up, check expiry and stamp last use in a single statement
+            stmt = (
+                update(APIKeyModel)
+                .where(
+                    APIKeyModel.keyHash == hash_api_key(key),
+                    or_(col(APIKeyModel.expiresAt).is_(None), col(APIKeyModel.expiresAt) >= now),
+                )
+                .values(lastUsedAt=now)
+                .returning(
+                    col(APIKeyModel.id), col(APIKeyModel.userId), col(APIKeyModel.permissions)
+                )
+            )
+            async with self._session_maker() as session:
+                row = (await session.execute(stmt)).one_or_none()
+                await session.commit()
 
-            # Check if expired
-            if api_key.expires_at and api_key.expires_at < datetime.now():
+            if row is None:
                 return None
 
-            # Update last used
-            await self.update_api_key_last_used(api_key.id)
-
+            key_id, user_id, permissions = row
             return {
-                "userId": api_key.user_id,
+                "userId": user_id,
                 "permissions": {
-                    "devices": api_key.permissions.devices,
-                    "scopes": api_key.permissions.scopes,
+                    "devices": permissions.get("devices", []),
+                    "scopes": permissions.get("scopes", ["read", "write"]),
                 },
-                "keyId": api_key.id,
+                "keyId": str(key_id),
             }
 
         except Exception as e:
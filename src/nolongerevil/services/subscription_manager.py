@@ -1,18 +1,25 @@
 """Subscription manager for long-polling connections.
 
 Long-poll subscriptions hold the HTTP connection open without sending any response.
-The notification queue wakes the handler when data arrives. When data is pushed
-to the queue, the transport handler sends a complete HTTP response and closes.
+Each subscription's ready Event wakes the handler when data arrives. When a payload
+is pushed onto its pending deque, the transport handler sends a complete HTTP
+response and closes.
+
+Notifications are encoded to the response body once and the same bytes are
+pushed to every subscriber of the device.
 """
 
 import asyncio
+import itertools
+import math
 import time
-import uuid
+from collections import OrderedDict, defaultdict, deque
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Any
 
-from nolongerevil.config import settings
+import orjson
+
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.types import DeviceObject
 
@@ -21,25 +28,102 @@ logger = get_logger(__name__)
 # If a subscription ended within this window, the next subscribe is a "re-subscribe"
 RESUBSCRIBE_WINDOW_SECONDS = 5.0
 
+# Cap on remembered subscription end times (oldest are evicted first)
+MAX_TRACKED_SUBSCRIPTION_ENDS = 10_000
+
+# Start of an encoded notification body, {"objects":[...]}; lets push() skip
+# decoding bodies that cannot be merged
+_OBJECTS_PREFIX = b'{"objects":['
+
 
-@dataclass
+def _merge_payloads(first: bytes, second: bytes) -> bytes | None:
+    """Merge two notification bodies into one with a single entry per object.
+
+    An object present in both bodies keeps its position from the first body
+    but takes its value from the second, so the device only sees the newest
+    revision.
+
+    Args:
+        first: Earlier encoded body
+        second: Later encoded body
+
+    Returns:
+        Combined body, or None if either body is not a non-empty objects payload
+    """
+    if not (first.startswith(_OBJECTS_PREFIX) and second.startswith(_OBJECTS_PREFIX)):
+        return None
+    try:
+        first_objects = orjson.loads(first)["objects"]
+        second_objects = orjson.loads(second)["objects"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return None
+    if not first_objects or not second_objects:
+        return None
+
+    # Objects without an object_key are kept as-is under their position
+    merged: dict[Any, Any] = {}
+    for index, obj in enumerate([*first_objects, *second_objects]):
+        key = obj.get("object_key") if isinstance(obj, dict) else None
+        merged[index if key is None else key] = obj
+    return orjson.dumps({"objects": list(merged.values())})
+
+
+@dataclass(slots=True)
 class LongPollSubscription:
     """A long-poll subscription for server-push to devices.
 
     The transport layer holds the HTTP connection open (chunked headers sent,
-    body pending) and waits on the notify_queue. When data is pushed to the
-    queue, the transport sends the body and closes.
+    body pending) and waits in next_payload(). When data is pushed, the
+    transport sends the body and closes.
+
+    Pending payloads sit in a plain deque with an Event to wake the single
+    transport consumer; asyncio.Queue's task tracking and waiter futures are
+    not needed for one producer side that never blocks.
 
     Each subscription has a unique server-generated ID. The device's session_id
     is preserved for logging but not used as a key - devices reuse session IDs
     across requests, which would cause race conditions if used for keying.
     """
 
-    id: str  # Server-generated UUID (unique per subscription)
+    id: str  # Server-generated, unique per subscription within this process
     serial: str
     session_id: str  # Device-provided, for logging only
-    notify_queue: asyncio.Queue[list[dict[str, Any]]] = field(default_factory=asyncio.Queue)
-    created_at: datetime = field(default_factory=datetime.now)
+    pending: deque[bytes] = field(default_factory=deque)
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    created_at: float = field(default_factory=time.monotonic)  # Monotonic, like subscription ends
+
+    def push(self, payload: bytes) -> None:
+        """Queue an encoded payload and wake the transport.
+
+        A burst that arrives before the transport drains is coalesced into the
+        last pending body, so the device gets one chunk instead of several and
+        only the newest version of each object.
+
+        Args:
+            payload: Encoded response body
+        """
+        if self.pending:
+            merged = _merge_payloads(self.pending[-1], payload)
+            if merged is not None:
+                self.pending[-1] = merged
+                self.ready.set()
+                return
+        self.pending.append(payload)
+        self.ready.set()
+
+    async def next_payload(self) -> bytes:
+        """Wait for and return the next queued payload.
+
+        Safe to cancel (e.g. by asyncio.wait_for): a payload is only removed
+        once nothing is left to await.
+
+        Returns:
+            Encoded response body
+        """
+        while not self.pending:
+            self.ready.clear()
+            await self.ready.wait()
+        return self.pending.popleft()
 
 
 class SubscriptionManager:
@@ -47,16 +131,25 @@ class SubscriptionManager:
 
     Long-poll subscriptions:
     - Connection is held open without sending HTTP response
-    - Notification queue wakes the transport handler when data arrives
+    - Pushing a payload wakes the transport handler via the subscription's ready Event
     - Transport sends complete response and closes
+
+    No lock is needed: none of the methods that mutate state await, so each
+    one runs to completion on the event loop without interleaving.
     """
 
     def __init__(self) -> None:
         """Initialize the subscription manager."""
-        self._long_poll_subscriptions: dict[str, dict[str, LongPollSubscription]] = {}
-        self._last_subscription_end: dict[str, float] = {}  # serial -> timestamp
-        self._pending_pushes: dict[str, list[dict[str, Any]]] = {}
-        self._lock = asyncio.Lock()
+        self._long_poll_subscriptions: defaultdict[str, dict[str, LongPollSubscription]] = (
+            defaultdict(dict)
+        )
+        # serial -> timestamp, least recently ended first
+        self._last_subscription_end: OrderedDict[str, float] = OrderedDict()
+        self._pending_pushes: dict[str, list[bytes]] = {}
+        self._long_poll_count = 0  # Running total across all devices
+        self._max_per_device = get_settings().max_subscriptions_per_device
+        # IDs are only dict keys and log labels, so a counter is enough
+        self._id_counter = itertools.count(1)
 
     # ========== Long-Poll Subscription Methods ==========
 
@@ -68,7 +161,7 @@ class SubscriptionManager:
         """Add a long-poll subscription (connection held without response).
 
         Returns the subscription object for the caller to use directly. The
-        subscription is keyed by a server-generated UUID, not the device's
+        subscription is keyed by a server-generated ID, not the device's
         session_id, to avoid race conditions when the device reuses session IDs.
 
         Args:
@@ -78,40 +171,37 @@ class SubscriptionManager:
         Returns:
             LongPollSubscription if added, None if limit exceeded
         """
-        async with self._lock:
-            device_subs = self._long_poll_subscriptions.get(serial, {})
-            if len(device_subs) >= settings.max_subscriptions_per_device:
-                logger.warning(
-                    f"Max subscriptions ({settings.max_subscriptions_per_device}) "
-                    f"exceeded for device {serial}"
-                )
-                return None
-
-            subscription = LongPollSubscription(
-                id=str(uuid.uuid4()),
-                serial=serial,
-                session_id=session_id,
-            )
+        max_subscriptions = self._max_per_device
+        device_subs = self._long_poll_subscriptions.get(serial, {})
+        if len(device_subs) >= max_subscriptions:
+            logger.warning(f"Max subscriptions ({max_subscriptions}) exceeded for device {serial}")
+            return None
+
+        subscription = LongPollSubscription(
+            id=f"{next(self._id_counter):016x}",
+            serial=serial,
+            session_id=session_id,
+        )
+
+        self._long_poll_subscriptions[serial][subscription.id] = subscription
+        self._long_poll_count += 1
 
-            if serial not in self._long_poll_subscriptions:
-                self._long_poll_subscriptions[serial] = {}
-            self._long_poll_subscriptions[serial][subscription.id] = subscription
-
-            # Replay any pending pushes that failed delivery on the previous connection
-            pending = self._pending_pushes.pop(serial, None)
-            if pending:
-                subscription.notify_queue.put_nowait(pending)
-                logger.info(
-                    f"Replayed {len(pending)} pending object(s) to new subscription "
-                    f"{subscription.id} for {serial}"
-                )
-
-            logger.debug(
-                f"Added subscription {subscription.id} for {serial} "
-                f"(session={session_id}, total={len(self._long_poll_subscriptions[serial])})"
+        # Replay any pending pushes that failed delivery on the previous connection
+        pending = self._pending_pushes.pop(serial, None)
+        if pending:
+            for payload in pending:
+                subscription.push(payload)
+            logger.info(
+                f"Replayed {len(pending)} pending payload(s) to new subscription "
+                f"{subscription.id} for {serial}"
             )
 
-            return subscription
+        logger.debug(
+            f"Added subscription {subscription.id} for {serial} "
+            f"(session={session_id}, total={len(self._long_poll_subscriptions[serial])})"
+        )
+
+        return subscription
 
     async def remove_long_poll_subscription(self, subscription: LongPollSubscription) -> None:
         """Remove a specific subscription by its unique ID.
@@ -119,63 +209,78 @@ class SubscriptionManager:
         Args:
             subscription: The subscription object to remove
         """
-        async with self._lock:
-            device_subs = self._long_poll_subscriptions.get(subscription.serial, {})
-            if subscription.id in device_subs:
-                del device_subs[subscription.id]
-                self._last_subscription_end[subscription.serial] = time.monotonic()
-                logger.debug(f"Removed subscription {subscription.id} for {subscription.serial}")
+        # Read with get() so removal never creates an empty entry
+        device_subs = self._long_poll_subscriptions.get(subscription.serial, {})
+        if device_subs.pop(subscription.id, None) is not None:
+            self._long_poll_count -= 1
+            self._record_subscription_end(subscription.serial)
+            logger.debug(f"Removed subscription {subscription.id} for {subscription.serial}")
+
+        # Drop emptied devices so devices_with_subscriptions stays accurate
+        if not device_subs:
+            self._long_poll_subscriptions.pop(subscription.serial, None)
 
-            if not device_subs and subscription.serial in self._long_poll_subscriptions:
-                del self._long_poll_subscriptions[subscription.serial]
+    def _record_subscription_end(self, serial: str) -> None:
+        """Remember when a device's subscription ended, evicting the oldest entries.
+
+        Args:
+            serial: Device serial number
+        """
+        ends = self._last_subscription_end
+        ends[serial] = time.monotonic()
+        ends.move_to_end(serial)
+        while len(ends) > MAX_TRACKED_SUBSCRIPTION_ENDS:
+            ends.popitem(last=False)
 
-    async def store_pending_push(self, serial: str, objects: list[dict[str, Any]]) -> None:
-        """Buffer objects that failed delivery due to a broken connection.
+    async def store_pending_push(self, serial: str, payload: bytes) -> None:
+        """Buffer a payload that failed delivery due to a broken connection.
 
         The next call to add_long_poll_subscription for this serial will
-        replay these objects to the new subscription's queue.
+        replay the buffered payloads to the new subscription.
         """
-        async with self._lock:
-            existing = self._pending_pushes.get(serial, [])
-            existing.extend(objects)
-            self._pending_pushes[serial] = existing
-            logger.info(
-                f"Buffered {len(objects)} pending object(s) for {serial} "
-                f"(total pending: {len(existing)})"
-            )
+        existing = self._pending_pushes.setdefault(serial, [])
+        existing.append(payload)
+        logger.info(f"Buffered pending payload for {serial} (total pending: {len(existing)})")
 
-    async def notify_long_poll_subscribers(
+    def notify_long_poll_subscribers(
         self,
         serial: str,
         changed_objects: list[dict[str, Any]],
     ) -> int:
         """Notify all long-poll subscribers for a device.
 
-        This puts data on each subscription's queue. The transport layer
-        (which is waiting on the queue) will wake up, send the HTTP response,
-        and close the connection.
+        The objects are encoded once and the resulting body is pushed to each
+        subscription. The transport layer (waiting in next_payload()) will wake
+        up, send the HTTP response, and close the connection.
+
+        This is a plain function: it never awaits, so it needs no coroutine frame.
 
         Args:
             serial: Device serial number
-            changed_objects: List of changed object dicts
+            changed_objects: List of changed object dicts, already formatted
+                for the device
 
         Returns:
-            Number of subscribers notified (queued)
+            Number of subscribers notified
         """
         notified = 0
 
-        async with self._lock:
-            device_subs = self._long_poll_subscriptions.get(serial, {})
+        # Nothing below awaits, so the subscription dict cannot change under us
+        device_subs = self._long_poll_subscriptions.get(serial)
+        if not device_subs or not changed_objects:
+            return 0
+
+        payload = orjson.dumps({"objects": changed_objects})
 
-            for sub_id, sub in device_subs.items():
-                try:
-                    # Put data on queue - transport layer will read and respond
-                    sub.notify_queue.put_nowait(changed_objects)
-                    notified += 1
-                    logger.debug(f"Queued notification for subscription {sub_id}")
+        for sub_id, sub in device_subs.items():
+            try:
+                # Push the payload - transport layer will read and respond
+                sub.push(payload)
+                notified += 1
+                logger.debug(f"Queued notification for subscription {sub_id}")
 
-                except Exception as e:
-                    logger.debug(f"Failed to queue notification for {sub_id}: {e}")
+            except Exception as e:
+                logger.debug(f"Failed to queue notification for {sub_id}: {e}")
 
         return notified
 
@@ -193,7 +298,8 @@ class SubscriptionManager:
         Returns:
             Total number of subscribers notified
         """
-        if not updated_objects:
+        # Skip formatting entirely when nobody is listening
+        if not updated_objects or not self._long_poll_subscriptions.get(serial):
             return 0
 
         # IMPORTANT: object_revision and object_timestamp MUST come before object_key
@@ -207,46 +313,7 @@ class SubscriptionManager:
             }
             for obj in updated_objects
         ]
-        return await self.notify_long_poll_subscribers(serial, formatted_objects)
-
-    async def notify_subscribers_with_dicts(
-        self,
-        serial: str,
-        formatted_objects: list[dict[str, Any]],
-    ) -> int:
-        """Notify subscribers with pre-formatted dicts.
-
-        Args:
-            serial: Device serial number
-            formatted_objects: List of pre-formatted object dicts
-
-        Returns:
-            Total number of subscribers notified
-        """
-        if not formatted_objects:
-            return 0
-        return await self.notify_long_poll_subscribers(serial, formatted_objects)
-
-    async def notify_all_subscribers(
-        self,
-        serial: str,
-        updated_objects: list[DeviceObject] | list[dict[str, Any]],
-    ) -> int:
-        """Notify all subscribers for a device.
-
-        Args:
-            serial: Device serial number
-            updated_objects: List of DeviceObject instances or pre-formatted dicts
-
-        Returns:
-            Total number of subscribers notified
-        """
-        if not updated_objects:
-            return 0
-
-        if isinstance(updated_objects[0], DeviceObject):
-            return await self.notify_subscribers_with_objects(serial, updated_objects)  # type: ignore
-        return await self.notify_subscribers_with_dicts(serial, updated_objects)  # type: ignore
+        return self.notify_long_poll_subscribers(serial, formatted_objects)
 
     # ========== Utility Methods ==========
 
@@ -256,14 +323,11 @@ class SubscriptionManager:
 
     def get_total_subscription_count(self) -> int:
         """Get total subscriptions across all devices."""
-        return sum(len(subs) for subs in self._long_poll_subscriptions.values())
+        return self._long_poll_count
 
     def has_active_subscription(self, serial: str) -> bool:
         """Check if device has any active subscription."""
-        return (
-            serial in self._long_poll_subscriptions
-            and len(self._long_poll_subscriptions[serial]) > 0
-        )
+        return bool(self._long_poll_subscriptions.get(serial))
 
     def is_resubscribe(self, serial: str) -> bool:
         """Check if this is a re-subscribe (recent subscription ended).
@@ -274,10 +338,13 @@ class SubscriptionManager:
 
         Returns False if this is a fresh subscribe (no recent history).
         """
-        last_end = self._last_subscription_end.get(serial)
-        if last_end is None:
-            return False
-        return (time.monotonic() - last_end) < RESUBSCRIBE_WINDOW_SECONDS
+        # No history reads as -inf, which is never inside the window
+        last_end = self._last_subscription_end.get(serial, -math.inf)
+        if (time.monotonic() - last_end) < RESUBSCRIBE_WINDOW_SECONDS:
+            return True
+        # Expired entries are never useful again
+        self._last_subscription_end.pop(serial, None)
+        return False
 
     def get_stats(self) -> dict[str, Any]:
         """Get subscription statistics."""
@@ -5,7 +5,7 @@ from typing import Any
 
 import aiohttp
 
-from nolongerevil.config import settings
+from nolongerevil.config import get_settings
 from nolongerevil.lib.logger import get_logger
 from nolongerevil.lib.types import WeatherData
 from nolongerevil.services.abstract_device_state_manager import AbstractDeviceStateManager
@@ -63,13 +63,14 @@ class WeatherService:
             True if cache is valid
         """
         age = datetime.now() - weather.fetched_at
-        return age < timedelta(seconds=settings.weather_cache_ttl_seconds)
+        return age < timedelta(seconds=get_settings().weather_cache_ttl_seconds)
 
     async def get_weather(
         self,
         postal_code: str | None = None,
         country: str | None = None,
         query_string: str | None = None,
+        cache_key: str | None = None,
     ) -> dict[str, Any] | None:
         """Get weather data, using cache if available.
 
@@ -77,12 +78,14 @@ class WeatherService:
             postal_code: Postal/ZIP code
             country: Country code (e.g., "US")
             query_string: Raw query string from request
+            cache_key: Canonical key for the requested location, used in place
+                of the postal code when the request does not carry one
 
         Returns:
             Weather data dictionary or None on error
         """
         # Determine cache key
-        cache_postal = postal_code or "ip"
+        cache_postal = postal_code or cache_key or "ip"
         cache_country = country or "auto"
 
         # Check cache
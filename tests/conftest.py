@@ -1,10 +1,8 @@
 """Pytest fixtures and configuration."""
 
 import gc
-import tempfile
 import threading
-from collections.abc import AsyncGenerator, Generator
-from pathlib import Path
+from collections.abc import AsyncGenerator
 
 import pytest
 import pytest_asyncio
@@ -16,19 +14,15 @@ from nolongerevil.services.subscription_manager import SubscriptionManager
 from nolongerevil.services.weather_service import WeatherService
 
 
-@pytest.fixture
-def temp_db_path() -> Generator[str, None, None]:
-    """Create a temporary database path."""
-    with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as f:
-        yield f.name
-    Path(f.name).unlink(missing_ok=True)
-
-
 @pytest_asyncio.fixture
-async def sqlmodel_service(temp_db_path: str) -> AsyncGenerator[SQLModelService, None]:
-    """Create and initialize a SQLModelService."""
-    db_url = f"sqlite+aiosqlite:///{temp_db_path}"
-    service = SQLModelService(db_url)
+async def sqlmodel_service() -> AsyncGenerator[SQLModelService, None]:
+    """Create and initialize a SQLModelService.
+
+    Uses an in-memory database; aiosqlite keeps it on a single shared
+    connection (StaticPool), so each test gets a fresh schema without
+    touching disk.
+    """
+    service = SQLModelService("sqlite+aiosqlite:///:memory:")
     await service.initialize()
     yield service
     await service.close()
@@ -1,6 +1,6 @@
 """Tests for configuration module."""
 
-from nolongerevil.config.environment import Settings
+from nolongerevil.config.environment import Settings, get_settings
 
 
 class TestSettings:
@@ -38,3 +38,40 @@ class TestSettings:
 
         assert settings.server_port == 8443
         assert settings.debug_logging is True
+
+    def test_api_origin_with_port_adds_server_port(self):
+        """Test that an explicit port is added when the origin has none."""
+        settings = Settings(api_origin="https://nest.example.com", server_port=8443)
+        assert settings.api_origin_with_port == "https://nest.example.com:8443"
+
+    def test_api_origin_with_port_keeps_explicit_port(self):
+        """Test that an origin with an explicit port is returned unchanged."""
+        settings = Settings(api_origin="https://nest.example.com:9443", server_port=8443)
+        assert settings.api_origin_with_port == "https://nest.example.com:9443"
+
+    def test_api_origin_with_port_preserves_path_and_ipv6(self):
+        """Test that the port is spliced into the authority only."""
+        settings = Settings(api_origin="http://[::1]/nest", server_port=8443)
+        assert settings.api_origin_with_port == "http://[::1]:8443/nest"
+
+        settings = Settings(api_origin="http://[::1]:9000/nest", server_port=8443)
+        assert settings.api_origin_with_port == "http://[::1]:9000/nest"
+
+    def test_api_origin_with_port_is_cached(self):
+        """Test that the computed origin is reused across accesses."""
+        settings = Settings(api_origin="http://localhost")
+        assert settings.api_origin_with_port is settings.api_origin_with_port
+
+
+class TestGetSettings:
+    """Tests for the shared settings accessor."""
+
+    def test_returns_singleton(self):
+        """Test that repeated calls return the same instance."""
+        assert get_settings() is get_settings()
+
+    def test_settings_alias_is_lazy_singleton(self):
+        """Test that the legacy `settings` name resolves to the shared instance."""
+        from nolongerevil.config import settings
+
+        assert settings is get_settings()
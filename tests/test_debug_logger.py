@@ -0,0 +1,240 @@
+"""Tests for debug logger middleware."""
+
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+
+from nolongerevil.config.environment import Settings
+from nolongerevil.lib.types import APIKey, APIKeyPermissions
+from nolongerevil.main import create_control_app
+from nolongerevil.middleware.api_key_auth import hash_api_key
+from nolongerevil.middleware.debug_logger import _LogWriter, create_debug_logger_middleware
+
+
+async def _wait_for_logs(log_dir: Path, count: int = 1) -> list[dict]:
+    """Wait for the background writer to append log entries."""
+    for _ in range(100):
+        entries = [
+            json.loads(line)
+            for log_file in sorted(log_dir.glob("debug-*.jsonl"))
+            for line in log_file.read_text().splitlines()
+        ]
+        if len(entries) >= count:
+            return entries
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"expected {count} log entries in {log_dir}")
+
+
+def _make_app(log_dir: Path, **overrides) -> web.Application:
+    """Create an app with debug logging enabled, writing to log_dir."""
+    settings = Settings(debug_logging=True, debug_logs_dir=str(log_dir), **overrides)
+    app = web.Application()
+    with patch("nolongerevil.middleware.debug_logger.get_settings", return_value=settings):
+        app.middlewares.append(create_debug_logger_middleware(app))
+
+    async def ok(_request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    async def boom(_request: web.Request) -> web.Response:
+        raise RuntimeError("boom")
+
+    app.router.add_post("/nest/ok", ok)
+    app.router.add_get("/nest/boom", boom)
+    return app
+
+
+@pytest.fixture
+def debug_app(tmp_path: Path) -> web.Application:
+    """Create an app with debug logging enabled, writing to tmp_path."""
+    return _make_app(tmp_path)
+
+
+class TestDebugLoggerMiddleware:
+    """Tests for the debug logger middleware."""
+
+    async def test_logs_request_and_response(self, aiohttp_client, debug_app, tmp_path):
+        """Test that a request/response pair is written to the log directory."""
+        client = await aiohttp_client(debug_app)
+        resp = await client.post("/nest/ok?x=1", json={"serial": "02AA01AC"})
+        assert resp.status == 200
+
+        (entry,) = await _wait_for_logs(tmp_path)
+
+        assert entry["request_id"] == f"{entry['timestamp']}_nest_ok"
+        assert entry["request"]["method"] == "POST"
+        assert entry["request"]["path"] == "/nest/ok"
+        assert entry["request"]["query"] == {"x": "1"}
+        assert entry["request"]["body"] == {"serial": "02AA01AC"}
+        assert entry["request"]["headers"]["Content-Type"] == "application/json"
+        assert entry["response"]["status"] == 200
+        assert entry["response"]["headers"]["Content-Type"].startswith("application/json")
+
+    async def test_logs_errors(self, aiohttp_client, debug_app, tmp_path):
+        """Test that handler exceptions are logged with error details."""
+        client = await aiohttp_client(debug_app)
+        resp = await client.get("/nest/boom")
+        assert resp.status == 500
+
+        (entry,) = await _wait_for_logs(tmp_path)
+
+        assert entry["error"]["type"] == "RuntimeError"
+        assert entry["error"]["message"] == "boom"
+
+    async def test_skips_success_when_disabled(self, aiohttp_client, tmp_path):
+        """Test that 2xx responses are not logged when debug_log_success is off."""
+        client = await aiohttp_client(_make_app(tmp_path, debug_log_success=False))
+        assert (await client.post("/nest/ok", json={})).status == 200
+        assert (await client.get("/nest/boom")).status == 500
+
+        await _wait_for_logs(tmp_path)
+        await asyncio.sleep(0.05)
+        (entry,) = await _wait_for_logs(tmp_path)
+        assert entry["error"]["type"] == "RuntimeError"
+
+    async def test_non_json_body_not_buffered(self, aiohttp_client, debug_app, tmp_path):
+        """Test that non-JSON bodies are recorded as a placeholder, not read."""
+        client = await aiohttp_client(debug_app)
+        resp = await client.post(
+            "/nest/ok", data=b"\x00" * 32, headers={"Content-Type": "application/octet-stream"}
+        )
+        assert resp.status == 200
+
+        (entry,) = await _wait_for_logs(tmp_path)
+
+        assert entry["request"]["body"] == {
+            "content_type": "application/octet-stream",
+            "length": 32,
+        }
+
+    async def test_large_json_body_not_buffered(self, aiohttp_client, tmp_path):
+        """Test that JSON bodies above debug_log_max_body are not read."""
+        client = await aiohttp_client(_make_app(tmp_path, debug_log_max_body=8))
+        resp = await client.post("/nest/ok", json={"serial": "02AA01AC"})
+        assert resp.status == 200
+
+        (entry,) = await _wait_for_logs(tmp_path)
+
+        assert entry["request"]["body"]["content_type"] == "application/json"
+
+    async def test_chunked_json_body_not_buffered(self, aiohttp_client, tmp_path):
+        """Test that JSON bodies without a Content-Length are not read."""
+        client = await aiohttp_client(_make_app(tmp_path))
+
+        async def chunks():
+            yield b'{"serial": '
+            yield b'"02AA01AC"}'
+
+        resp = await client.post(
+            "/nest/ok", data=chunks(), headers={"Content-Type": "application/json"}
+        )
+        assert resp.status == 200
+
+        (entry,) = await _wait_for_logs(tmp_path)
+
+        assert entry["request"]["body"] == {"content_type": "application/json", "length": None}
+
+    async def test_unserializable_body_does_not_drop_batch(self, tmp_path):
+        """Test that an entry orjson cannot encode is replaced, not lost with its batch."""
+        nested: list = []
+        for _ in range(300):  # orjson.loads accepts this depth; orjson.dumps does not
+            nested = [nested]
+
+        writer = _LogWriter(tmp_path)
+        writer.submit({"request_id": "bad", "request": {"path": "/nest/ok", "body": nested}})
+        writer.submit({"request_id": "good", "request": {"path": "/nest/ok", "body": {"a": 1}}})
+        await writer.close()
+
+        entries = await _wait_for_logs(tmp_path, count=2)
+
+        assert [entry["request_id"] for entry in entries] == ["bad", "good"]
+        assert entries[0]["request"] == {"path": "/nest/ok", "body": "<unserializable>"}
+        assert entries[1]["request"]["body"] == {"a": 1}
+
+    async def test_cleanup_writes_queued_entries(self, aiohttp_client, debug_app, tmp_path):
+        """Test that app cleanup writes out queued entries before returning."""
+        client = await aiohttp_client(debug_app)
+        for _ in range(3):
+            assert (await client.post("/nest/ok", json={})).status == 200
+
+        await client.close()
+
+        (log_file,) = tmp_path.iterdir()
+        assert len(log_file.read_text().splitlines()) == 3
+
+    async def test_appends_to_single_file(self, aiohttp_client, debug_app, tmp_path):
+        """Test that multiple requests are appended as lines to one JSONL file."""
+        client = await aiohttp_client(debug_app)
+        for _ in range(3):
+            assert (await client.post("/nest/ok", json={})).status == 200
+
+        entries = await _wait_for_logs(tmp_path, count=3)
+
+        assert len(list(tmp_path.iterdir())) == 1
+        assert [next(iter(entry)) for entry in entries] == ["request_id"] * 3
+
+
+class TestDebugLogsRoute:
+    """Tests for serving debug logs on the control API."""
+
+    @pytest.fixture
+    async def logs_client(
+        self, aiohttp_client, tmp_path, state_service, subscription_manager, device_availability
+    ):
+        """Create a control API client with debug log browsing enabled."""
+        (tmp_path / "debug-2024-01-01-00.jsonl").write_text('{"secret": true}\n')
+        settings = Settings(debug_logging=True, debug_logs_http=True, debug_logs_dir=str(tmp_path))
+        with patch("nolongerevil.main.get_settings", return_value=settings):
+            app = create_control_app(
+                state_service, subscription_manager, device_availability, state_service.storage
+            )
+        return await aiohttp_client(app)
+
+    async def _create_key(self, state_service, scopes: list[str]) -> str:
+        """Store an API key with the given scopes and return the raw key."""
+        raw_key = f"nlapi_{'_'.join(scopes)}"
+        await state_service.storage.create_api_key(
+            APIKey(
+                id="1",
+                key_hash=hash_api_key(raw_key),
+                key_preview=raw_key[:12],
+                user_id="user_admin",
+                name="Debug",
+                permissions=APIKeyPermissions(scopes=scopes),
+                created_at=datetime.now(),
+            )
+        )
+        return raw_key
+
+    async def test_requires_api_key(self, logs_client):
+        """Test that logs cannot be listed or read without an API key."""
+        for path in ("/debug/logs/", "/debug/logs/debug-2024-01-01-00.jsonl"):
+            resp = await logs_client.get(path)
+            assert resp.status == 401
+            assert "Access-Control-Allow-Origin" not in resp.headers
+
+    async def test_requires_admin_scope(self, logs_client, state_service):
+        """Test that a key without the admin scope is rejected."""
+        key = await self._create_key(state_service, ["read", "write"])
+        resp = await logs_client.get(
+            "/debug/logs/debug-2024-01-01-00.jsonl", headers={"X-API-Key": key}
+        )
+        assert resp.status == 403
+
+    async def test_admin_key_can_read_logs(self, logs_client, state_service):
+        """Test that an admin key can list and read log files without CORS headers."""
+        key = await self._create_key(state_service, ["admin"])
+        headers = {"Authorization": f"Bearer {key}"}
+
+        index = await logs_client.get("/debug/logs/", headers=headers)
+        assert index.status == 200
+        assert "debug-2024-01-01-00.jsonl" in await index.text()
+
+        resp = await logs_client.get("/debug/logs/debug-2024-01-01-00.jsonl", headers=headers)
+        assert resp.status == 200
+        assert await resp.text() == '{"secret": true}\n'
+        assert "Access-Control-Allow-Origin" not in resp.headers
@@ -1,5 +1,7 @@
 """Tests for device availability service."""
 
+import asyncio
+import time
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
@@ -8,6 +10,7 @@ import pytest
 from nolongerevil.services.device_availability import (
     DEFAULT_CHECK_INTERVAL,
     DEFAULT_DEVICE_TIMEOUT,
+    MIN_CHECK_INTERVAL,
     DeviceAvailability,
     DeviceStatus,
 )
@@ -39,11 +42,11 @@ class TestDeviceStatus:
         status = DeviceStatus(serial="TEST123")
         assert status.serial == "TEST123"
         assert status.is_available is True
-        assert isinstance(status.last_seen, datetime)
+        assert isinstance(status.last_seen, float)
 
     def test_custom_values(self):
         """Test custom values for DeviceStatus."""
-        custom_time = datetime(2024, 1, 1, 12, 0, 0)
+        custom_time = 1234.5
         status = DeviceStatus(
             serial="TEST123",
             last_seen=custom_time,
@@ -101,7 +104,7 @@ class TestMarkDeviceSeen:
         availability_service._devices["TEST123"] = DeviceStatus(
             serial="TEST123",
             is_available=False,
-            last_seen=datetime.now() - timedelta(hours=1),
+            last_seen=time.monotonic() - 3600,
         )
 
         await availability_service.mark_device_seen("TEST123")
@@ -114,7 +117,8 @@ class TestMarkDeviceSeen:
         availability_service.set_integration_manager(mock_integration_manager)
 
         await availability_service.mark_device_seen("NEW_DEVICE")
-        mock_integration_manager.on_device_connected.assert_called_once_with("NEW_DEVICE")
+        await asyncio.gather(*availability_service._callback_tasks)
+        mock_integration_manager.on_device_connected.assert_awaited_once_with("NEW_DEVICE")
 
     @pytest.mark.asyncio
     async def test_notifies_integration_manager_on_reconnect(self, availability_service):
@@ -129,7 +133,53 @@ class TestMarkDeviceSeen:
         )
 
         await availability_service.mark_device_seen("TEST123")
-        mock_integration_manager.on_device_connected.assert_called_once_with("TEST123")
+        await asyncio.gather(*availability_service._callback_tasks)
+        mock_integration_manager.on_device_connected.assert_awaited_once_with("TEST123")
+
+    @pytest.mark.asyncio
+    async def test_does_not_wait_for_integrations(self, availability_service):
+        """Test that a slow integration callback does not block mark_device_seen."""
+        release = asyncio.Event()
+
+        async def slow_connected(_serial: str) -> None:
+            await release.wait()
+
+        mock_integration_manager = MagicMock()
+        mock_integration_manager.on_device_connected = slow_connected
+        availability_service.set_integration_manager(mock_integration_manager)
+
+        await asyncio.wait_for(availability_service.mark_device_seen("NEW_DEVICE"), timeout=1)
+        assert availability_service._callback_tasks
+
+        release.set()
+        await asyncio.gather(*availability_service._callback_tasks)
+        assert not availability_service._callback_tasks
+
+    async def test_callbacks_for_a_device_run_in_order(self, availability_service):
+        """Test that a disconnect callback waits for the device's slower connect callback."""
+        release = asyncio.Event()
+        events: list[str] = []
+
+        async def slow_connected(serial: str) -> None:
+            await release.wait()
+            events.append(f"connected {serial}")
+
+        async def disconnected(serial: str) -> None:
+            events.append(f"disconnected {serial}")
+
+        mock_integration_manager = MagicMock()
+        mock_integration_manager.on_device_connected = slow_connected
+        mock_integration_manager.on_device_disconnected = disconnected
+        availability_service.set_integration_manager(mock_integration_manager)
+
+        await availability_service.mark_device_seen("TEST123")
+        await availability_service._mark_device_unavailable("TEST123")
+        await asyncio.sleep(0)
+        assert events == []
+
+        release.set()
+        await asyncio.gather(*list(availability_service._callback_tasks))
+        assert events == ["connected TEST123", "disconnected TEST123"]
 
 
 class TestIsAvailable:
@@ -167,6 +217,7 @@ class TestGetLastSeen:
         await availability_service.mark_device_seen("TEST123")
         last_seen = availability_service.get_last_seen("TEST123")
         assert isinstance(last_seen, datetime)
+        assert abs((datetime.now() - last_seen).total_seconds()) < 5
 
 
 class TestGetAllStatuses:
@@ -207,8 +258,9 @@ class TestMarkDeviceUnavailable:
 
         await availability_service.mark_device_seen("TEST123")
         await availability_service._mark_device_unavailable("TEST123")
+        await asyncio.gather(*availability_service._callback_tasks)
 
-        mock_integration_manager.on_device_disconnected.assert_called_once_with("TEST123")
+        mock_integration_manager.on_device_disconnected.assert_awaited_once_with("TEST123")
 
     @pytest.mark.asyncio
     async def test_unknown_device_is_ignored(self, availability_service):
@@ -231,6 +283,56 @@ class TestMarkDeviceUnavailable:
         mock_integration_manager.on_device_disconnected.assert_not_called()
 
 
+class TestCheckDevices:
+    """Tests for _check_devices method."""
+
+    @pytest.mark.asyncio
+    async def test_marks_only_stale_devices_unavailable(self, mock_subscription_manager):
+        """Test that devices past the timeout are marked unavailable."""
+        service = DeviceAvailability(mock_subscription_manager, timeout_seconds=0)
+        mock_subscription_manager.has_active_subscription.side_effect = lambda s: s == "ACTIVE"
+        service.initialize_from_serials(["STALE", "ACTIVE"])
+
+        await service._check_devices()
+
+        assert service.is_available("STALE") is False
+        assert service.is_available("ACTIVE") is True
+        assert [serial for _, serial in service._expiry_heap] == ["ACTIVE"]
+
+    @pytest.mark.asyncio
+    async def test_skips_devices_not_yet_due(self, availability_service, mock_subscription_manager):
+        """Test that devices whose deadline has not passed are not examined."""
+        await availability_service.mark_device_seen("TEST123")
+
+        await availability_service._check_devices()
+
+        mock_subscription_manager.has_active_subscription.assert_not_called()
+        assert availability_service.is_available("TEST123") is True
+
+
+class TestNextCheckDelay:
+    """Tests for _next_check_delay method."""
+
+    def test_uses_check_interval_when_idle(self, mock_subscription_manager):
+        """Test that the full interval is used with no tracked devices."""
+        service = DeviceAvailability(mock_subscription_manager, check_interval_seconds=30)
+        assert service._next_check_delay() == 30
+
+    def test_wakes_at_next_deadline(self, mock_subscription_manager):
+        """Test that the loop wakes early for a deadline inside the interval."""
+        service = DeviceAvailability(
+            mock_subscription_manager, timeout_seconds=10, check_interval_seconds=30
+        )
+        service.initialize_from_serials(["TEST123"])
+        assert 9 < service._next_check_delay() <= 10
+
+    def test_clamped_to_minimum(self, mock_subscription_manager):
+        """Test that overdue deadlines do not produce a busy loop."""
+        service = DeviceAvailability(mock_subscription_manager, timeout_seconds=0)
+        service.initialize_from_serials(["TEST123"])
+        assert service._next_check_delay() == MIN_CHECK_INTERVAL
+
+
 class TestSetIntegrationManager:
     """Tests for set_integration_manager method."""
 
@@ -239,3 +341,33 @@ class TestSetIntegrationManager:
         mock_manager = MagicMock()
         availability_service.set_integration_manager(mock_manager)
         assert availability_service._integration_manager is mock_manager
+
+
+class TestStop:
+    """Tests for stop method."""
+
+    async def test_cancels_pending_callbacks(self, availability_service):
+        """Test that stop cancels integration callbacks that are still running."""
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def hanging_connected(_serial: str) -> None:
+            started.set()
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        mock_integration_manager = MagicMock()
+        mock_integration_manager.on_device_connected = hanging_connected
+        availability_service.set_integration_manager(mock_integration_manager)
+
+        await availability_service.mark_device_seen("TEST123")
+        await started.wait()
+
+        await asyncio.wait_for(availability_service.stop(), timeout=1)
+
+        assert cancelled.is_set()
+        assert not availability_service._callback_tasks
+        assert not availability_service._device_callbacks
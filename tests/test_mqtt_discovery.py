@@ -0,0 +1,105 @@
+"""Tests for Home Assistant MQTT discovery generation."""
+
+import json
+
+from nolongerevil.integrations.mqtt.home_assistant_discovery import (
+    get_all_discovery_configs,
+    get_all_discovery_configs_encoded,
+    get_discovery_removal_topics,
+)
+
+SERIAL = "02AA01AC"
+
+
+def _configs(mode: str | None = "heat", label: str = "Hallway") -> dict[str, dict]:
+    shared = {"target_temperature_type": mode, "label": label}
+    return dict(get_all_discovery_configs(SERIAL, {}, shared, "nest", "homeassistant"))
+
+
+class TestGetAllDiscoveryConfigs:
+    """Tests for get_all_discovery_configs."""
+
+    def test_climate_payload(self):
+        """Test the climate entity topic and core fields."""
+        configs = _configs()
+        climate = configs[f"homeassistant/climate/nest_{SERIAL}/thermostat/config"]
+
+        assert climate["unique_id"] == f"nolongerevil_{SERIAL}"
+        assert climate["name"] == "Hallway"
+        assert climate["availability"]["topic"] == f"nest/{SERIAL}/availability"
+        assert climate["mode_command_topic"] == f"nest/{SERIAL}/ha/mode/set"
+
+    def test_heat_mode_has_single_setpoint(self):
+        """Test heat mode exposes the single temperature topics."""
+        climate = _configs("heat")[f"homeassistant/climate/nest_{SERIAL}/thermostat/config"]
+
+        assert climate["temperature_state_topic"] == f"nest/{SERIAL}/ha/target_temperature"
+        assert "temperature_low_state_topic" not in climate
+
+    def test_range_mode_has_two_setpoints(self):
+        """Test heat_cool mode exposes low/high temperature topics."""
+        climate = _configs("range")[f"homeassistant/climate/nest_{SERIAL}/thermostat/config"]
+
+        assert climate["temperature_low_state_topic"] == f"nest/{SERIAL}/ha/target_temperature_low"
+        assert climate["temperature_high_state_topic"] == (
+            f"nest/{SERIAL}/ha/target_temperature_high"
+        )
+        assert "temperature_state_topic" not in climate
+
+    def test_sensor_payload(self):
+        """Test a sensor entity payload."""
+        sensor = _configs()[f"homeassistant/sensor/nest_{SERIAL}/temperature/config"]
+
+        assert sensor["state_topic"] == f"nest/{SERIAL}/ha/current_temperature"
+        assert sensor["unit_of_measurement"] == "°C"
+        assert sensor["device"] == {"identifiers": [f"nolongerevil_{SERIAL}"]}
+
+    def test_repeated_calls_return_independent_copies(self):
+        """Test that modifying a returned payload does not change the memoized config."""
+        shared = {"target_temperature_type": "cool"}
+        first = get_all_discovery_configs(SERIAL, {}, shared, "nest", "homeassistant")
+        first[0][1]["availability"]["topic"] = "changed"
+        first[0][1]["extra"] = True
+
+        second = get_all_discovery_configs(SERIAL, {}, shared, "nest", "homeassistant")
+
+        assert second[0][1]["availability"]["topic"] == f"nest/{SERIAL}/availability"
+        assert "extra" not in second[0][1]
+
+    def test_mode_change_rebuilds_climate(self):
+        """Test that a mode change produces a different climate payload."""
+        heat = _configs("heat")[f"homeassistant/climate/nest_{SERIAL}/thermostat/config"]
+        cool = _configs("off")[f"homeassistant/climate/nest_{SERIAL}/thermostat/config"]
+
+        assert heat is not cool
+        assert "temperature_state_topic" not in cool
+
+
+class TestGetDiscoveryRemovalTopics:
+    """Tests for get_discovery_removal_topics."""
+
+    def test_matches_published_topics(self):
+        """Test that every published discovery topic is cleared on removal."""
+        published = set(_configs())
+        assert set(get_discovery_removal_topics(SERIAL, "homeassistant")) == published
+
+    def test_memoized(self):
+        """Test that repeated removals reuse the same topics."""
+        assert get_discovery_removal_topics(SERIAL) is get_discovery_removal_topics(SERIAL)
+
+
+class TestGetAllDiscoveryConfigsEncoded:
+    """Tests for get_all_discovery_configs_encoded."""
+
+    def test_matches_json_of_payloads(self):
+        """Test that encoded payloads are the JSON of the dict payloads."""
+        shared = {"target_temperature_type": "range", "label": "Hallway"}
+        plain = list(get_all_discovery_configs(SERIAL, {}, shared, "nest", "homeassistant"))
+        encoded = list(
+            get_all_discovery_configs_encoded(SERIAL, {}, shared, "nest", "homeassistant")
+        )
+
+        assert [topic for topic, _ in encoded] == [topic for topic, _ in plain]
+        assert [payload for _, payload in encoded] == [
+            json.dumps(payload).encode() for _, payload in plain
+        ]
@@ -0,0 +1,144 @@
+"""Tests for MQTT topic builder utilities."""
+
+from nolongerevil.integrations.mqtt.topic_builder import (
+    build_availability_topic,
+    build_command_topic,
+    build_state_topic,
+    make_command_parser,
+    make_ha_command_parser,
+    parse_command_topic,
+    parse_ha_command_topic,
+    parse_object_key,
+)
+
+
+class TestParseObjectKey:
+    """Tests for parse_object_key."""
+
+    def test_splits_type_and_serial(self):
+        """Test a standard object key."""
+        assert parse_object_key("device.SERIAL123") == ("device", "SERIAL123")
+
+    def test_splits_on_first_dot_only(self):
+        """Test that only the first dot separates type from serial."""
+        assert parse_object_key("schedule.A.B") == ("schedule", "A.B")
+
+    def test_no_dot(self):
+        """Test a key without a serial."""
+        assert parse_object_key("device") == ("device", "")
+
+
+class TestBuildTopics:
+    """Tests for topic builders."""
+
+    def test_state_topic_with_field(self):
+        """Test state topic for a single field."""
+        assert build_state_topic("nest", "S1", "shared", "target_temperature") == (
+            "nest/S1/shared/target_temperature"
+        )
+
+    def test_state_topic_without_field(self):
+        """Test state topic for a full object."""
+        assert build_state_topic("nest", "S1", "device") == "nest/S1/device"
+
+    def test_command_topic(self):
+        """Test command topic."""
+        assert build_command_topic("nest", "S1", "shared", "hvac_mode") == (
+            "nest/S1/shared/hvac_mode/set"
+        )
+
+    def test_availability_topic(self):
+        """Test availability topic."""
+        assert build_availability_topic("nest", "S1") == "nest/S1/availability"
+
+
+class TestParseCommandTopic:
+    """Tests for parse_command_topic."""
+
+    def test_valid_topic(self):
+        """Test parsing a well-formed command topic."""
+        assert parse_command_topic("nest", "nest/S1/shared/target_temperature/set") == (
+            "S1",
+            "shared",
+            "target_temperature",
+        )
+
+    def test_round_trip(self):
+        """Test parsing a topic produced by build_command_topic."""
+        topic = build_command_topic("home/nest", "S1", "device", "fan_mode")
+        assert parse_command_topic("home/nest", topic) == ("S1", "device", "fan_mode")
+
+    def test_wrong_prefix(self):
+        """Test topics under another prefix are rejected."""
+        assert parse_command_topic("nest", "other/S1/shared/field/set") is None
+        assert parse_command_topic("nest", "nestx/S1/shared/field/set") is None
+
+    def test_missing_set_suffix(self):
+        """Test state topics are rejected."""
+        assert parse_command_topic("nest", "nest/S1/shared/field") is None
+
+    def test_wrong_segment_count(self):
+        """Test topics with too few or too many segments are rejected."""
+        assert parse_command_topic("nest", "nest/S1/field/set") is None
+        assert parse_command_topic("nest", "nest/S1/shared/a/b/set") is None
+        assert parse_command_topic("nest", "nest/set") is None
+
+    def test_empty_segment(self):
+        """Test topics with an empty segment are rejected."""
+        assert parse_command_topic("nest", "nest/S1//field/set") is None
+
+    def test_prefix_with_regex_characters(self):
+        """Test prefixes are matched literally."""
+        assert parse_command_topic("a.b", "a.b/S1/shared/f/set") == ("S1", "shared", "f")
+        assert parse_command_topic("a.b", "axb/S1/shared/f/set") is None
+
+
+class TestParseHaCommandTopic:
+    """Tests for parse_ha_command_topic."""
+
+    def test_valid_topic(self):
+        """Test parsing an HA command topic."""
+        assert parse_ha_command_topic("nest", "nest/S1/ha/mode/set") == ("S1", "mode")
+
+    def test_non_ha_topic(self):
+        """Test raw command topics are rejected."""
+        assert parse_ha_command_topic("nest", "nest/S1/shared/mode/set") is None
+
+    def test_prefix_with_regex_characters(self):
+        """Test prefixes are matched literally."""
+        assert parse_ha_command_topic("a.b", "a.b/S1/ha/preset/set") == ("S1", "preset")
+        assert parse_ha_command_topic("a.b", "axb/S1/ha/preset/set") is None
+
+    def test_command_may_contain_slashes(self):
+        """Test that the command segment may span several levels."""
+        assert parse_ha_command_topic("nest", "nest/S1/ha/a/b/set") == ("S1", "a/b")
+
+    def test_empty_command(self):
+        """Test topics without a command are rejected."""
+        assert parse_ha_command_topic("nest", "nest/S1/ha//set") is None
+        assert parse_ha_command_topic("nest", "nest/S1/ha/set") is None
+
+
+class TestMakeCommandParser:
+    """Tests for prefix-bound command parsers."""
+
+    def test_raw_parser(self):
+        """Test the bound raw command parser."""
+        parse = make_command_parser("nest")
+        assert parse("nest/S1/shared/target_temperature/set") == (
+            "S1",
+            "shared",
+            "target_temperature",
+        )
+        assert parse("nest/S1/ha/mode") is None
+
+    def test_ha_parser(self):
+        """Test the bound HA command parser."""
+        parse = make_ha_command_parser("nest")
+        assert parse("nest/S1/ha/mode/set") == ("S1", "mode")
+        assert parse("other/S1/ha/mode/set") is None
+
+    def test_parsers_are_reused_per_prefix(self):
+        """Test that a parser is built once per prefix."""
+        assert make_command_parser("nest") is make_command_parser("nest")
+        assert make_ha_command_parser("nest") is make_ha_command_parser("nest")
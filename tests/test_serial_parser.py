@@ -1,7 +1,12 @@
 """Tests for serial parser utilities."""
 
+from unittest.mock import patch
+
+from aiohttp.test_utils import make_mocked_request
+
 from nolongerevil.lib.serial_parser import (
     extract_serial_from_basic_auth,
+    extract_serial_from_request,
     sanitize_serial,
 )
 
@@ -37,6 +42,10 @@ class TestSanitizeSerial:
         """Test rejection of whitespace only."""
         assert sanitize_serial("   ") is None
 
+    def test_non_ascii_alphanumerics_removed(self):
+        """Test that non-ASCII letters and digits are stripped like other symbols."""
+        assert sanitize_serial("ABC123DEF456é²") == "ABC123DEF456"
+
 
 class TestExtractSerialFromBasicAuth:
     """Tests for extract_serial_from_basic_auth function."""
@@ -67,3 +76,30 @@ class TestExtractSerialFromBasicAuth:
         header = f"Basic {encoded}"
 
         assert extract_serial_from_basic_auth(header) is None
+
+
+class TestExtractSerialFromRequest:
+    """Tests for extract_serial_from_request function."""
+
+    def test_query_parameter(self):
+        """Test extraction from the serial query parameter."""
+        request = make_mocked_request("GET", "/nest/entry?serial=abc123def456")
+        assert extract_serial_from_request(request) == "ABC123DEF456"
+
+    def test_not_found(self):
+        """Test that None is returned when no source carries a serial."""
+        request = make_mocked_request("GET", "/nest/entry")
+        assert extract_serial_from_request(request) is None
+
+    def test_memoized_per_request(self):
+        """Test that repeated calls on one request only extract once."""
+        request = make_mocked_request(
+            "GET", "/nest/entry", headers={"X-nl-device-id": "ABC123DEF456"}
+        )
+        with patch(
+            "nolongerevil.lib.serial_parser._extract_serial_from_request",
+            return_value="ABC123DEF456",
+        ) as mock_extract:
+            assert extract_serial_from_request(request) == "ABC123DEF456"
+            assert extract_serial_from_request(request) == "ABC123DEF456"
+        mock_extract.assert_called_once_with(request)
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta
 
-import pytest
+from sqlalchemy import text
 
 from nolongerevil.lib.types import (
     APIKey,
@@ -18,6 +18,13 @@ from nolongerevil.lib.types import (
     UserInfo,
     WeatherData,
 )
+from nolongerevil.services.sqlmodel_service import hash_api_key
+
+# Fixed timestamp for records whose time is just data; tests that exercise
+# expiry use the wall clock instead
+NOW = datetime(2024, 1, 1)
+ONE_HOUR = timedelta(hours=1)
+SEVEN_DAYS = timedelta(days=7)
 
 
 class TestSQLModelService:
@@ -32,7 +39,7 @@ class TestSQLModelService:
             object_revision=1,
             object_timestamp=1234567890000,
             value={"test": "data", "number": 42},
-            updated_at=datetime.now(),
+            updated_at=NOW,
         )
         await sqlmodel_service.upsert_object(obj)
 
@@ -64,35 +71,85 @@ class TestSQLModelService:
     async def test_get_objects_by_serial(self, sqlmodel_service):
         """Test retrieving all objects for a device."""
         # Create multiple objects for same serial
-        for i in range(3):
-            obj = DeviceObject(
-                serial="MULTI",
-                object_key=f"key_{i}",
-                object_revision=1,
-                object_timestamp=1234567890000,
-                value={"index": i},
-                updated_at=datetime.now(),
-            )
-            await sqlmodel_service.upsert_object(obj)
+        await sqlmodel_service.upsert_objects(
+            [
+                DeviceObject(
+                    serial="MULTI",
+                    object_key=f"key_{i}",
+                    object_revision=1,
+                    object_timestamp=1234567890000,
+                    value={"index": i},
+                    updated_at=NOW,
+                )
+                for i in range(3)
+            ]
+        )
 
         # Retrieve all
         objects = await sqlmodel_service.get_objects_by_serial("MULTI")
         assert len(objects) == 3
         assert all(obj.serial == "MULTI" for obj in objects)
 
+    async def test_upsert_objects_updates_existing(self, sqlmodel_service):
+        """Test that a batch upsert updates rows that already exist."""
+        obj = DeviceObject(
+            serial="BATCH",
+            object_key="device.BATCH",
+            object_revision=1,
+            object_timestamp=1234567890000,
+            value={"target": 20.0},
+            updated_at=NOW,
+        )
+        await sqlmodel_service.upsert_object(obj)
+
+        obj.object_revision = 2
+        obj.value = {"target": 21.0}
+        new_obj = DeviceObject(
+            serial="BATCH",
+            object_key="shared.BATCH",
+            object_revision=1,
+            object_timestamp=1234567890000,
+            value={},
+            updated_at=NOW,
+        )
+        await sqlmodel_service.upsert_objects([obj, new_obj])
+
+        updated = await sqlmodel_service.get_object("BATCH", "device.BATCH")
+        assert updated is not None
+        assert updated.object_revision == 2
+        assert updated.value == {"target": 21.0}
+        assert len(await sqlmodel_service.get_objects_by_serial("BATCH")) == 2
+
+    async def test_reads_legacy_text_json(self, sqlmodel_service):
+        """Test that JSON stored as plain text by older versions is still readable."""
+        async with sqlmodel_service.engine.begin() as conn:
+            await conn.execute(
+                text(
+                    "INSERT INTO states VALUES "
+                    "('LEGACY', 'device.LEGACY', 1, 2, '{\"target\": 21.5}', 3)"
+                )
+            )
+
+        obj = await sqlmodel_service.get_object("LEGACY", "device.LEGACY")
+        assert obj is not None
+        assert obj.value == {"target": 21.5}
+
     async def test_delete_device(self, sqlmodel_service):
         """Test deleting all objects for a device."""
         # Create multiple objects
-        for i in range(5):
-            obj = DeviceObject(
-                serial="DELETE_ME",
-                object_key=f"key_{i}",
-                object_revision=1,
-                object_timestamp=1234567890000,
-                value={"index": i},
-                updated_at=datetime.now(),
-            )
-            await sqlmodel_service.upsert_object(obj)
+        await sqlmodel_service.upsert_objects(
+            [
+                DeviceObject(
+                    serial="DELETE_ME",
+                    object_key=f"key_{i}",
+                    object_revision=1,
+                    object_timestamp=1234567890000,
+                    value={"index": i},
+                    updated_at=NOW,
+                )
+                for i in range(5)
+            ]
+        )
 
         # Delete all
         count = await sqlmodel_service.delete_device("DELETE_ME")
@@ -107,7 +164,7 @@ class TestSQLModelService:
         user = UserInfo(
             clerk_id="user_abc123",
             email="test@example.com",
-            created_at=datetime.now(),
+            created_at=NOW,
         )
         await sqlmodel_service.create_user(user)
 
@@ -130,12 +187,13 @@ class TestSQLModelService:
 
     async def test_entry_key_operations(self, sqlmodel_service):
         """Test entry key creation, retrieval, and claiming."""
+        # Claiming checks expiry against the wall clock
         now = datetime.now()
         entry_key = EntryKey(
             code="ABC123",
             serial="DEVICE1",
             created_at=now,
-            expires_at=now + timedelta(hours=1),
+            expires_at=now + ONE_HOUR,
         )
         await sqlmodel_service.create_entry_key(entry_key)
 
@@ -168,7 +226,7 @@ class TestSQLModelService:
         owner = DeviceOwner(
             serial="OWNED1",
             user_id="user_owner",
-            created_at=datetime.now(),
+            created_at=NOW,
         )
         await sqlmodel_service.set_device_owner(owner)
 
@@ -186,7 +244,7 @@ class TestSQLModelService:
         weather = WeatherData(
             postal_code="12345",
             country="US",
-            fetched_at=datetime.now(),
+            fetched_at=NOW,
             data={
                 "current": {"temp": 72, "condition": "sunny"},
                 "location": {"city": "Test City"},
@@ -219,7 +277,7 @@ class TestSQLModelService:
                 devices=["DEVICE1", "DEVICE2"],
                 scopes=["read", "write"],
             ),
-            created_at=datetime.now(),
+            created_at=NOW,
         )
         await sqlmodel_service.create_api_key(api_key)
 
@@ -233,7 +291,7 @@ class TestSQLModelService:
         # Get user keys
         user_keys = await sqlmodel_service.get_user_api_keys("user_123")
         assert len(user_keys) >= 1
-        assert any(k.key_hash == "hash123" for k in user_keys)
+        assert "hash123" in {k.key_hash for k in user_keys}
 
         # Update last used
         await sqlmodel_service.update_api_key_last_used(retrieved.id)
@@ -254,7 +312,7 @@ class TestSQLModelService:
             shared_with_user_id="user2",
             serial="SHARED1",
             permissions=DeviceSharePermission.READ,
-            created_at=datetime.now(),
+            created_at=NOW,
         )
         await sqlmodel_service.create_device_share(share)
 
@@ -292,8 +350,9 @@ class TestSQLModelService:
             serial="DEVICE1",
             permissions=DeviceSharePermission.WRITE,
             status=DeviceShareInviteStatus.PENDING,
+            # Accepting checks expiry against the wall clock
             invited_at=datetime.now(),
-            expires_at=datetime.now() + timedelta(days=7),
+            expires_at=datetime.now() + SEVEN_DAYS,
         )
         await sqlmodel_service.create_device_share_invite(invite)
 
@@ -318,8 +377,8 @@ class TestSQLModelService:
             type="mqtt",
             enabled=True,
             config={"broker": "mqtt://localhost", "topic": "test"},
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=NOW,
+            updated_at=NOW,
         )
         await sqlmodel_service.upsert_integration(integration)
 
@@ -332,11 +391,11 @@ class TestSQLModelService:
         # Get enabled integrations
         enabled = await sqlmodel_service.get_enabled_integrations()
         assert len(enabled) >= 1
-        assert any(i.type == "mqtt" for i in enabled)
+        assert "mqtt" in {i.type for i in enabled}
 
         # Update
         integration.config["topic"] = "updated"
-        integration.updated_at = datetime.now()
+        integration.updated_at = NOW
         await sqlmodel_service.upsert_integration(integration)
 
         updated = await sqlmodel_service.get_integrations("user1")
@@ -369,13 +428,11 @@ class TestSQLModelService:
         user = UserInfo(
             clerk_id="user_test",
             email="test@example.com",
-            created_at=datetime.now(),
+            created_at=NOW,
         )
         await sqlmodel_service.create_user(user)
 
         # Create API key
-        from nolongerevil.services.sqlmodel_service import hash_api_key
-
         raw_key = "test_key_12345"
         api_key = APIKey(
             id="1",
@@ -384,7 +441,7 @@ class TestSQLModelService:
             user_id="user_test",
             name="Test",
             permissions=APIKeyPermissions(devices=[], scopes=["read", "write"]),
-            created_at=datetime.now(),
+            created_at=NOW,
         )
         await sqlmodel_service.create_api_key(api_key)
 
@@ -394,10 +451,36 @@ class TestSQLModelService:
         assert result["userId"] == "user_test"
         assert "read" in result["permissions"]["scopes"]
 
+        # Validation stamps last use
+        stored = await sqlmodel_service.get_api_key_by_hash(hash_api_key(raw_key))
+        assert stored is not None
+        assert stored.last_used_at is not None
+
+    async def test_validate_expired_api_key(self, sqlmodel_service):
+        """Test that an expired API key is rejected and not marked as used."""
+        raw_key = "expired_key_12345"
+        api_key = APIKey(
+            id="1",
+            key_hash=hash_api_key(raw_key),
+            key_preview="expi...",
+            user_id="user_test",
+            name="Expired",
+            permissions=APIKeyPermissions(devices=[], scopes=["read"]),
+            created_at=NOW,
+            expires_at=NOW,
+        )
+        await sqlmodel_service.create_api_key(api_key)
+
+        assert await sqlmodel_service.validate_api_key(raw_key) is None
+
+        stored = await sqlmodel_service.get_api_key_by_hash(hash_api_key(raw_key))
+        assert stored is not None
+        assert stored.last_used_at is None
+
     async def test_list_user_devices(self, sqlmodel_service):
         """Test listing user devices."""
         # Create user
-        user = UserInfo(clerk_id="user_list", email="list@example.com", created_at=datetime.now())
+        user = UserInfo(clerk_id="user_list", email="list@example.com", created_at=NOW)
         await sqlmodel_service.create_user(user)
 
         # Create ownership
@@ -405,7 +488,7 @@ class TestSQLModelService:
             owner = DeviceOwner(
                 serial=f"DEVICE{i}",
                 user_id="user_list",
-                created_at=datetime.now(),
+                created_at=NOW,
             )
             await sqlmodel_service.set_device_owner(owner)
 
@@ -415,7 +498,6 @@ class TestSQLModelService:
         assert all("serial" in d for d in devices)
 
 
-@pytest.mark.asyncio
 async def test_sqlmodel_specific_initialization(sqlmodel_service):
     """Test SQLModel-specific initialization."""
     # Verify service is initialized
@@ -429,7 +511,7 @@ async def test_sqlmodel_specific_initialization(sqlmodel_service):
         object_revision=1,
         object_timestamp=123,
         value={},
-        updated_at=datetime.now(),
+        updated_at=NOW,
     )
     await sqlmodel_service.upsert_object(obj)
 
@@ -1,8 +1,19 @@
 """Tests for subscription manager."""
 
+import asyncio
+import time
+from datetime import datetime
+
+import orjson
 import pytest
 
-from nolongerevil.services.subscription_manager import SubscriptionManager
+from nolongerevil.lib.types import DeviceObject
+from nolongerevil.services import subscription_manager as subscription_manager_module
+from nolongerevil.services.subscription_manager import (
+    RESUBSCRIBE_WINDOW_SECONDS,
+    LongPollSubscription,
+    SubscriptionManager,
+)
 
 
 class TestSubscriptionManager:
@@ -33,6 +44,28 @@ class TestSubscriptionManager:
 
         assert subscription_manager.get_subscription_count("TEST12345678") == 0
 
+    @pytest.mark.asyncio
+    async def test_subscription_ids_are_unique(self, subscription_manager: SubscriptionManager):
+        """Test that reused session IDs still get distinct subscription IDs."""
+        first = await subscription_manager.add_long_poll_subscription("TEST12345678", "same")
+        second = await subscription_manager.add_long_poll_subscription("TEST12345678", "same")
+
+        assert first.id != second.id
+        assert subscription_manager.get_subscription_count("TEST12345678") == 2
+
+    @pytest.mark.asyncio
+    async def test_total_count_survives_double_remove(
+        self, subscription_manager: SubscriptionManager
+    ):
+        """Test that removing a subscription twice only decrements the total once."""
+        first = await subscription_manager.add_long_poll_subscription("TEST12345678", "s1")
+        await subscription_manager.add_long_poll_subscription("TEST12345678", "s2")
+
+        await subscription_manager.remove_long_poll_subscription(first)
+        await subscription_manager.remove_long_poll_subscription(first)
+
+        assert subscription_manager.get_total_subscription_count() == 1
+
     @pytest.mark.asyncio
     async def test_notify_long_poll_subscribers(self, subscription_manager: SubscriptionManager):
         """Test notifying long-poll subscribers."""
@@ -50,7 +83,7 @@ class TestSubscriptionManager:
             }
         ]
 
-        notified = await subscription_manager.notify_long_poll_subscribers(
+        notified = subscription_manager.notify_long_poll_subscribers(
             "TEST12345678",
             changed_objects,
         )
@@ -58,9 +91,9 @@ class TestSubscriptionManager:
         assert notified == 1
 
         # Data should be in the queue
-        queued_data = subscription.notify_queue.get_nowait()
-        assert len(queued_data) == 1
-        assert queued_data[0]["object_key"] == "device.TEST12345678"
+        queued_data = orjson.loads(subscription.pending.popleft())
+        assert len(queued_data["objects"]) == 1
+        assert queued_data["objects"][0]["object_key"] == "device.TEST12345678"
 
     @pytest.mark.asyncio
     async def test_notify_multiple_subscribers(self, subscription_manager: SubscriptionManager):
@@ -76,14 +109,55 @@ class TestSubscriptionManager:
 
         changed_objects = [{"object_key": "device.TEST12345678", "value": {}}]
 
-        notified = await subscription_manager.notify_long_poll_subscribers(
+        notified = subscription_manager.notify_long_poll_subscribers(
             "TEST12345678",
             changed_objects,
         )
 
         assert notified == 2
-        assert not sub1.notify_queue.empty()
-        assert not sub2.notify_queue.empty()
+        # Encoded once, shared by every subscriber
+        assert sub1.pending.popleft() is sub2.pending.popleft()
+
+    def test_notify_without_subscribers(self, subscription_manager: SubscriptionManager):
+        """Test that notifying a device with no subscribers is a no-op."""
+        notified = subscription_manager.notify_long_poll_subscribers(
+            "TEST12345678",
+            [{"object_key": "device.TEST12345678", "value": {}}],
+        )
+
+        assert notified == 0
+
+    @pytest.mark.asyncio
+    async def test_notify_objects_without_subscribers(
+        self, subscription_manager: SubscriptionManager
+    ):
+        """Test that objects are not formatted for a device nobody is subscribed to."""
+        obj = DeviceObject(
+            serial="TEST12345678",
+            object_key="device.TEST12345678",
+            object_revision=1,
+            object_timestamp=1234567890,
+            value={},
+            updated_at=datetime.now(),
+        )
+
+        notified = await subscription_manager.notify_subscribers_with_objects("TEST12345678", [obj])
+
+        assert notified == 0
+
+    @pytest.mark.asyncio
+    async def test_pending_push_replayed(self, subscription_manager: SubscriptionManager):
+        """Test that buffered payloads are replayed to the next subscription."""
+        await subscription_manager.store_pending_push("TEST12345678", b"first")
+        await subscription_manager.store_pending_push("TEST12345678", b"second")
+
+        subscription = await subscription_manager.add_long_poll_subscription(
+            "TEST12345678",
+            "session_123",
+        )
+
+        assert subscription.pending.popleft() == b"first"
+        assert subscription.pending.popleft() == b"second"
 
     @pytest.mark.asyncio
     async def test_has_active_subscription(self, subscription_manager: SubscriptionManager):
@@ -137,3 +211,87 @@ class TestSubscriptionManager:
 
         # Should now be detected as re-subscribe
         assert subscription_manager.is_resubscribe("TEST12345678") is True
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_history_is_bounded(
+        self, subscription_manager: SubscriptionManager, monkeypatch
+    ):
+        """Test that the oldest subscription end times are evicted."""
+        monkeypatch.setattr(subscription_manager_module, "MAX_TRACKED_SUBSCRIPTION_ENDS", 2)
+
+        for serial in ("DEVICE1", "DEVICE2", "DEVICE3"):
+            subscription = await subscription_manager.add_long_poll_subscription(serial, "s")
+            await subscription_manager.remove_long_poll_subscription(subscription)
+
+        assert subscription_manager.is_resubscribe("DEVICE1") is False
+        assert subscription_manager.is_resubscribe("DEVICE2") is True
+        assert subscription_manager.is_resubscribe("DEVICE3") is True
+
+    def test_expired_resubscribe_entry_dropped(self, subscription_manager: SubscriptionManager):
+        """Test that an entry outside the window is removed on read."""
+        subscription_manager._last_subscription_end["TEST12345678"] = (
+            time.monotonic() - RESUBSCRIBE_WINDOW_SECONDS - 1
+        )
+
+        assert subscription_manager.is_resubscribe("TEST12345678") is False
+        assert "TEST12345678" not in subscription_manager._last_subscription_end
+
+
+class TestLongPollSubscription:
+    """Tests for LongPollSubscription payload hand-off."""
+
+    @pytest.mark.asyncio
+    async def test_next_payload_waits_for_push(self):
+        """Test that a waiting consumer wakes when a payload is pushed."""
+        subscription = LongPollSubscription(id="1", serial="TEST12345678", session_id="s")
+        waiter = asyncio.create_task(subscription.next_payload())
+        await asyncio.sleep(0)
+
+        subscription.push(b"data")
+
+        assert await asyncio.wait_for(waiter, timeout=1) == b"data"
+
+    @pytest.mark.asyncio
+    async def test_timeout_does_not_lose_payload(self):
+        """Test that a timed-out wait leaves later payloads in place."""
+        subscription = LongPollSubscription(id="1", serial="TEST12345678", session_id="s")
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(subscription.next_payload(), timeout=0.01)
+
+        subscription.push(b"first")
+        subscription.push(b"second")
+
+        assert await subscription.next_payload() == b"first"
+        assert await subscription.next_payload() == b"second"
+        assert not subscription.pending
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced(self):
+        """Test that payloads pushed before the transport drains become one body."""
+        subscription = LongPollSubscription(id="1", serial="TEST12345678", session_id="s")
+
+        subscription.push(orjson.dumps({"objects": [{"object_key": "a"}]}))
+        subscription.push(orjson.dumps({"objects": [{"object_key": "b"}, {"object_key": "c"}]}))
+
+        body = orjson.loads(await subscription.next_payload())
+        assert [obj["object_key"] for obj in body["objects"]] == ["a", "b", "c"]
+        assert not subscription.pending
+
+    async def test_burst_keeps_newest_version_of_each_object(self):
+        """Test that an object notified twice before draining is sent once, at its newest version."""
+        subscription = LongPollSubscription(id="1", serial="TEST12345678", session_id="s")
+
+        subscription.push(
+            orjson.dumps(
+                {"objects": [{"object_key": "a", "object_revision": 1}, {"object_key": "b"}]}
+            )
+        )
+        subscription.push(orjson.dumps({"objects": [{"object_key": "a", "object_revision": 2}]}))
+
+        body = orjson.loads(await subscription.next_payload())
+        assert body["objects"] == [
+            {"object_key": "a", "object_revision": 2},
+            {"object_key": "b"},
+        ]
+        assert not subscription.pending
@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from nolongerevil.lib.types import WeatherData
+from nolongerevil.routes.nest.weather import weather_cache_key
 from nolongerevil.services.weather_service import WeatherService
 
 
@@ -96,8 +97,8 @@ class TestCacheValidity:
 
     def test_edge_case_just_expired(self, weather_service):
         """Test cache that just expired."""
-        with patch("nolongerevil.services.weather_service.settings") as mock_settings:
-            mock_settings.weather_cache_ttl_seconds = 300  # 5 minutes
+        with patch("nolongerevil.services.weather_service.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.weather_cache_ttl_seconds = 300  # 5 minutes
             weather = WeatherData(
                 postal_code="12345",
                 country="US",
@@ -228,3 +229,36 @@ class TestFetchWeather:
             assert result is None
 
         await weather_service.close()
+
+
+class TestWeatherCacheKey:
+    """Tests for the weather route's canonical cache key."""
+
+    def test_ignores_parameter_order(self):
+        """Test that parameter order does not change the key."""
+        assert weather_cache_key({"postal_code": "12345", "country": "US"}) == weather_cache_key(
+            {"country": "US", "postal_code": "12345"}
+        )
+
+    def test_ignores_unrelated_parameters(self):
+        """Test that non-location parameters do not change the key."""
+        assert weather_cache_key({"query": "12345,US", "_": "1700000000"}) == weather_cache_key(
+            {"query": "12345,US"}
+        )
+
+    def test_distinguishes_locations(self):
+        """Test that different locations produce different keys."""
+        assert weather_cache_key({"query": "12345,US"}) != weather_cache_key({"query": "90210,US"})
+
+    def test_none_without_location(self):
+        """Test that requests without location parameters have no key."""
+        assert weather_cache_key({"_": "1700000000"}) is None
+
+    @pytest.mark.asyncio
+    async def test_cache_key_used_without_postal_code(self, weather_service, mock_storage):
+        """Test that the cache key stands in for a missing postal code."""
+        weather_service._fetch_weather = AsyncMock(return_value=None)
+
+        await weather_service.get_weather(query_string="query=12345,US", cache_key="abc")
+
+        mock_storage.get_cached_weather.assert_called_with("abc", "auto")